@@ -9,6 +9,12 @@ import json
 import time
 
 import aiohttp
+import numpy as np
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional speedup
+    uvloop = None
 
 
 async def _run_one(
@@ -17,20 +23,20 @@ async def _run_one(
     payload: dict,
     headers: dict,
     sem: asyncio.Semaphore,
-    latencies: list[float],
-    errors: list[int],
+    idx: int,
+    latencies: np.ndarray,
+    status_codes: np.ndarray,
 ) -> None:
     async with sem:
         start = time.perf_counter()
         try:
             async with session.post(url, json=payload, headers=headers) as resp:
                 await resp.text()
-                if resp.status >= 400:
-                    errors.append(resp.status)
+                status_codes[idx] = resp.status
         except Exception:
-            errors.append(599)
+            status_codes[idx] = 599
         finally:
-            latencies.append(time.perf_counter() - start)
+            latencies[idx] = time.perf_counter() - start
 
 
 async def run_load_test(
@@ -39,29 +45,37 @@ async def run_load_test(
     concurrency: int,
     role: str,
     timeout: aiohttp.ClientTimeout,
-) -> tuple[float, float, float, float, int]:
+) -> tuple[float, float, float, float, int, dict[int, int]]:
     payload = {"message": "Get status"}
     headers = {"Content-Type": "application/json", "X-Roles": role}
 
     sem = asyncio.Semaphore(concurrency)
-    latencies: list[float] = []
-    errors: list[int] = []
-
-    async with aiohttp.ClientSession(timeout=timeout) as session:
+    latencies = np.empty(requests, dtype=np.float64)
+    status_codes = np.zeros(requests, dtype=np.int16)
+
+    connector = aiohttp.TCPConnector(
+        limit=concurrency,
+        limit_per_host=concurrency,
+        ttl_dns_cache=300,
+        keepalive_timeout=30,
+    )
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
         tasks = [
-            _run_one(session, url, payload, headers, sem, latencies, errors)
-            for _ in range(requests)
+            _run_one(session, url, payload, headers, sem, idx, latencies, status_codes)
+            for idx in range(requests)
         ]
         start = time.perf_counter()
         await asyncio.gather(*tasks)
         total = time.perf_counter() - start
 
-    latencies_sorted = sorted(latencies)
-    p50 = latencies_sorted[int(0.50 * len(latencies_sorted)) - 1]
-    p95 = latencies_sorted[int(0.95 * len(latencies_sorted)) - 1]
+    p50 = p95 = 0.0
+    if requests > 0:
+        p50, p95 = (float(p) for p in np.percentile(latencies, [50, 95]))
     rps = requests / total if total > 0 else 0.0
-    error_count = len(errors)
-    return total, rps, p50, p95, error_count
+    error_count = int(np.count_nonzero(status_codes >= 400))
+    counts = np.bincount(status_codes)
+    status_counts = {int(code): int(counts[code]) for code in np.flatnonzero(counts)}
+    return total, rps, p50, p95, error_count, status_counts
 
 
 def main() -> int:
@@ -74,7 +88,10 @@ def main() -> int:
     parser.add_argument("--max-error-rate", type=float, default=0.1)
     args = parser.parse_args()
 
-    total, rps, p50, p95, error_count = asyncio.run(
+    if uvloop is not None:
+        uvloop.install()
+
+    total, rps, p50, p95, error_count, status_counts = asyncio.run(
         run_load_test(
             url=args.url,
             requests=args.requests,
@@ -93,6 +110,7 @@ def main() -> int:
         "p50_ms": round(p50 * 1000, 2),
         "p95_ms": round(p95 * 1000, 2),
         "errors": error_count,
+        "status_codes": status_counts,
         "error_rate": round(error_rate, 3),
     }
 
@@ -2,9 +2,12 @@
 """Sign a policy file with Ed25519 private key."""
 
 import argparse
-import json
+import hashlib
 import sys
 from pathlib import Path
+from typing import Any
+
+import orjson
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -12,6 +15,11 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from twinops.agent.policy_signing import sign_policy, verify_policy_signature
 
 
+def _dump_json(data: dict[str, Any]) -> bytes:
+    """Serialize JSON with 2-space indentation."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Sign a policy file")
     parser.add_argument("--policy-file", "-p", required=True, help="Path to policy JSON file")
@@ -37,14 +45,15 @@ def main():
         print(f"Error: Private key not found: {private_key_path}")
         sys.exit(1)
 
-    # Read policy JSON (preserving exact bytes for signing)
-    policy_json = policy_path.read_text()
     private_pem = private_key_path.read_text()
 
-    # Sign the policy
-    signature = sign_policy(policy_json, private_pem)
+    # Read the policy once: the signature, digest, verification and output
+    # all use these exact bytes, so a concurrent edit cannot split them
+    policy_bytes = policy_path.read_bytes()
+    signature = sign_policy(policy_bytes, private_pem)
 
     print("Policy signed successfully")
+    print(f"SHA-512: {hashlib.sha512(policy_bytes).hexdigest()}")
     print(f"Signature: {signature[:32]}...")
 
     # Verify if requested
@@ -54,7 +63,7 @@ def main():
             print(f"Warning: Public key not found for verification: {public_key_path}")
         else:
             public_pem = public_key_path.read_text()
-            is_valid = verify_policy_signature(policy_json, public_pem, signature)
+            is_valid = verify_policy_signature(policy_bytes, public_pem, signature)
             if is_valid:
                 print("✓ Signature verified")
             else:
@@ -66,12 +75,12 @@ def main():
 
     # Write signed policy
     signed_output = {
-        "policy_json": policy_json,
+        "policy_json": policy_bytes.decode("utf-8"),
         "signature": signature,
     }
 
     # Also provide separate files for AAS integration
-    output_path.write_text(json.dumps(signed_output, indent=2))
+    output_path.write_bytes(_dump_json(signed_output))
     print(f"Signed policy saved to: {output_path}")
 
     # Write signature only file
@@ -1,5 +1,7 @@
 """Semantic capability index for tool retrieval."""
 
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -12,7 +14,7 @@ from twinops.common.logging import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CapabilityHit:
     """A tool matching a search query with relevance score."""
 
@@ -20,6 +22,23 @@ class CapabilityHit:
     score: float
 
 
+def _top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """Return indices of the top-k scores, sorted by descending score."""
+    if len(scores) <= top_k:
+        return np.argsort(scores)[::-1]
+    # Partial sort for efficiency
+    indices = np.argpartition(scores, -top_k)[-top_k:]
+    return indices[np.argsort(scores[indices])[::-1]]
+
+
+def _top_k(scores: np.ndarray, top_k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return (indices, scores) of the top-k positive scores."""
+    indices = _top_k_indices(scores, top_k)
+    top_scores = scores[indices]
+    keep = top_scores > 0
+    return indices[keep], top_scores[keep]
+
+
 class CapabilityIndex:
     """
     TF-IDF based index over tool descriptions.
@@ -33,25 +52,46 @@ class CapabilityIndex:
     - Vector database (Pinecone, Weaviate, Qdrant)
     """
 
-    def __init__(self, tools: list[ToolSpec] | None = None):
+    def __init__(
+        self,
+        tools: list[ToolSpec] | None = None,
+        query_cache_size: int = 512,
+    ):
         """
         Initialize the capability index.
 
         Args:
             tools: Initial list of tools to index
+            query_cache_size: Maximum number of transformed queries to memoize
         """
         self._tools: list[ToolSpec] = []
+        self._init_scorer(query_cache_size)
+        self._is_fitted = False
+        # Tool name -> (tool, corpus text), so add_tools only builds text for new tools
+        self._corpus_cache: dict[str, tuple[ToolSpec, str]] = {}
+        # Lookup indexes, rebuilt alongside the TF-IDF matrix
+        self._by_name: dict[str, ToolSpec] = {}
+        self._by_risk: dict[str, list[ToolSpec]] = defaultdict(list)
+        self._by_submodel: dict[str, list[ToolSpec]] = defaultdict(list)
+
+        if tools:
+            self.add_tools(tools)
+
+    def _init_scorer(self, query_cache_size: int) -> None:
+        """Create the TF-IDF vectorizer, its matrices and the query cache."""
         self._vectorizer = TfidfVectorizer(
             stop_words="english",
             ngram_range=(1, 2),
             max_features=1000,
+            dtype=np.float32,
         )
         # TF-IDF sparse matrix (scipy sparse type); keep as Any for typing flexibility.
         self._matrix: Any | None = None
-        self._is_fitted = False
-
-        if tools:
-            self.add_tools(tools)
+        # Dense, row-normalized float32 copy of the matrix used for scoring
+        self._dense: np.ndarray | None = None
+        # Normalized query -> transformed query vector (LRU, cleared on reindex)
+        self._query_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._query_cache_size = query_cache_size
 
     def add_tools(self, tools: list[ToolSpec]) -> None:
         """
@@ -71,28 +111,55 @@ class CapabilityIndex:
             tools: Complete list of tools
         """
         self._tools = list(tools)
+        self._corpus_cache.clear()
         self._reindex()
 
     def _reindex(self) -> None:
         """Rebuild the TF-IDF index."""
+        self._query_cache.clear()
+        self._rebuild_lookups()
         if not self._tools:
             self._is_fitted = False
             self._matrix = None
+            self._dense = None
             return
 
         # Build text corpus from tool metadata
-        texts = []
-        for tool in self._tools:
-            # Combine name, description, and parameter names
-            param_names = " ".join(tool.input_schema.get("properties", {}).keys())
-            text = f"{tool.name} {tool.description} {param_names}"
-            texts.append(text)
+        texts = [self._corpus_text(tool) for tool in self._tools]
 
         self._matrix = self._vectorizer.fit_transform(texts)
+        # The corpus is small (tools x <=1000 features), so a contiguous dense
+        # copy lets scoring run as a single BLAS matrix-vector product.
+        dense = self._matrix.toarray()
+        dense /= np.linalg.norm(dense, axis=1, keepdims=True) + 1e-12
+        self._dense = dense
         self._is_fitted = True
 
         logger.debug("Capability index rebuilt", tool_count=len(self._tools))
 
+    def _corpus_text(self, tool: ToolSpec) -> str:
+        """Get the indexed text for a tool, building it on first use."""
+        cached = self._corpus_cache.get(tool.name)
+        if cached is not None and cached[0] is tool:
+            return cached[1]
+
+        # Combine name, description, and parameter names
+        param_names = " ".join(tool.input_schema.get("properties", {}).keys())
+        text = f"{tool.name} {tool.description} {param_names}"
+        self._corpus_cache[tool.name] = (tool, text)
+        return text
+
+    def _rebuild_lookups(self) -> None:
+        """Rebuild the name, risk, and submodel lookup indexes."""
+        self._by_name = {}
+        self._by_risk = defaultdict(list)
+        self._by_submodel = defaultdict(list)
+        for tool in self._tools:
+            # First registration wins, matching the previous linear scan
+            self._by_name.setdefault(tool.name, tool)
+            self._by_risk[tool.risk_level].append(tool)
+            self._by_submodel[tool.submodel_id].append(tool)
+
     def search(self, query: str, top_k: int = 12) -> list[CapabilityHit]:
         """
         Search for tools matching a query.
@@ -104,40 +171,121 @@ class CapabilityIndex:
         Returns:
             List of matching tools with scores, sorted by relevance
         """
-        if not self._is_fitted or self._matrix is None:
+        # A blank query has an all-zero TF-IDF vector, so no tool can score
+        # above zero: skip vectorizing and scoring entirely.
+        if not query.strip():
             return []
+        return self._search_many([query], top_k)[0]
 
-        # Transform query
-        try:
-            q_vec = self._vectorizer.transform([query])
-        except Exception:
-            # Query contains only unknown terms
-            return []
+    def search_batch(self, queries: list[str], top_k: int = 12) -> list[list[CapabilityHit]]:
+        """
+        Search for tools matching several queries at once.
 
-        # Compute cosine similarity
-        scores = (self._matrix @ q_vec.T).toarray().flatten()
+        All queries are scored with a single matrix product, which is
+        cheaper than issuing one search per query.
 
-        # Get top-k indices
-        if len(scores) <= top_k:
-            indices = np.argsort(scores)[::-1]
-        else:
-            # Partial sort for efficiency
-            indices = np.argpartition(scores, -top_k)[-top_k:]
-            indices = indices[np.argsort(scores[indices])[::-1]]
+        Args:
+            queries: Natural language queries
+            top_k: Maximum number of results per query
 
-        # Build results
-        results = []
-        for idx in indices:
-            if scores[idx] > 0:
-                results.append(
-                    CapabilityHit(
-                        tool=self._tools[idx],
-                        score=float(scores[idx]),
-                    )
-                )
+        Returns:
+            One list of matching tools per query, each sorted by relevance
+        """
+        return self._search_many(queries, top_k)
+
+    def _search_many(self, queries: list[str], top_k: int) -> list[list[CapabilityHit]]:
+        """Score queries together; shared by search() and search_batch()."""
+        scores = self._score_queries(queries, top_k)
+        if scores is None:
+            return [[] for _ in queries]
 
+        results = []
+        for b in range(len(queries)):
+            indices, top_scores = _top_k(scores[:, b], top_k)
+            results.append(
+                [
+                    CapabilityHit(tool=self._tools[idx], score=float(score))
+                    for idx, score in zip(indices.tolist(), top_scores.tolist(), strict=True)
+                ]
+            )
         return results
 
+    def search_raw(self, query: str, top_k: int = 12) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Search for tools and return raw positions and scores.
+
+        Skips building CapabilityHit objects for callers that only need
+        ranking information; positions index into get_all_tools().
+
+        Args:
+            query: Natural language query
+            top_k: Maximum number of results
+
+        Returns:
+            Tuple of (tool indices, scores), sorted by descending score
+        """
+        scores = self._score_queries([query], top_k)
+        if scores is None:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+        return _top_k(scores[:, 0], top_k)
+
+    def _score_queries(self, queries: list[str], top_k: int) -> np.ndarray | None:
+        """Compute cosine similarity for every (tool, query) pair."""
+        if not queries or not self._is_fitted or self._dense is None or top_k <= 0:
+            return None
+
+        q_mat = self._transform_queries(queries)
+        if q_mat is None:
+            return None
+
+        # Shape (tools, queries)
+        scores: np.ndarray = self._dense @ q_mat.T
+        return scores
+
+    def _transform_queries(self, queries: list[str]) -> np.ndarray | None:
+        """
+        Transform queries into TF-IDF vectors, memoizing repeated queries.
+
+        Cache misses are transformed together in one vectorizer call.
+
+        Args:
+            queries: Natural language queries
+
+        Returns:
+            Dense normalized float32 matrix with one row per query, or None
+            if the queries cannot be transformed
+        """
+        keys = [q.strip().lower() for q in queries]
+        rows: dict[str, np.ndarray] = {}
+        misses: list[str] = []
+        for key in keys:
+            if key in rows:
+                continue
+            cached = self._query_cache.get(key)
+            if cached is not None:
+                self._query_cache.move_to_end(key)
+                rows[key] = cached
+            elif key not in misses:
+                misses.append(key)
+
+        if misses:
+            try:
+                sparse = self._vectorizer.transform(misses)
+            except Exception:
+                # Query contains only unknown terms
+                return None
+
+            dense = sparse.toarray()
+            dense /= np.linalg.norm(dense, axis=1, keepdims=True) + 1e-12
+            for key, row in zip(misses, dense, strict=True):
+                rows[key] = row
+                if self._query_cache_size > 0:
+                    self._query_cache[key] = row
+            while len(self._query_cache) > self._query_cache_size:
+                self._query_cache.popitem(last=False)
+
+        return np.stack([rows[key] for key in keys])
+
     def get_tool_by_name(self, name: str) -> ToolSpec | None:
         """
         Get a tool by exact name match.
@@ -148,10 +296,7 @@ class CapabilityIndex:
         Returns:
             ToolSpec or None
         """
-        for tool in self._tools:
-            if tool.name == name:
-                return tool
-        return None
+        return self._by_name.get(name)
 
     def get_all_tools(self) -> list[ToolSpec]:
         """Get all indexed tools."""
@@ -172,7 +317,7 @@ class CapabilityIndex:
         Returns:
             List of matching tools
         """
-        return [t for t in self._tools if t.risk_level == risk_level]
+        return list(self._by_risk.get(risk_level, ()))
 
     def get_tools_for_submodel(self, submodel_id: str) -> list[ToolSpec]:
         """
@@ -184,7 +329,114 @@ class CapabilityIndex:
         Returns:
             List of matching tools
         """
-        return [t for t in self._tools if t.submodel_id == submodel_id]
+        return list(self._by_submodel.get(submodel_id, ()))
+
+
+# Tool rows widened to float32 at a time when scoring the int8 index
+_INT8_SCORE_BLOCK_ROWS = 1024
+
+
+def _quantize_int8(vectors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Quantize row vectors to int8 with a symmetric per-row scale."""
+    scale = np.max(np.abs(vectors), axis=1) / 127.0
+    scale[scale == 0] = 1.0
+    quantized = np.round(vectors / scale[:, None]).astype(np.int8)
+    return quantized, scale.astype(np.float32)
+
+
+class Int8EmbeddingCapabilityIndex(CapabilityIndex):
+    """
+    Dense embedding index with int8-quantized tool vectors.
+
+    Tool texts are embedded once per reindex, L2-normalized and stored
+    as int8 with a per-row scale, a quarter of the float32 footprint.
+    Queries are embedded and quantized the same way and scored with an
+    integer dot product rescaled to cosine similarity.
+
+    Requires an encoder; by default sentence-transformers is loaded
+    lazily (install the ``embeddings`` extra).
+    """
+
+    def __init__(
+        self,
+        tools: list[ToolSpec] | None = None,
+        encoder: Callable[[list[str]], np.ndarray] | None = None,
+        model_name: str = "all-MiniLM-L6-v2",
+    ):
+        """
+        Initialize the embedding index.
+
+        Args:
+            tools: Initial list of tools to index
+            encoder: Function mapping texts to a (len(texts), dim) array
+            model_name: sentence-transformers model used when no encoder is given
+        """
+        # Set before the base initializer, which reindexes any initial tools
+        self._encoder = encoder
+        self._model_name = model_name
+        super().__init__(tools)
+
+    def _init_scorer(self, query_cache_size: int) -> None:
+        """Create the quantized matrix slots; no TF-IDF state is needed."""
+        self._quantized: np.ndarray | None = None
+        self._scale: np.ndarray | None = None
+
+    def _encode(self, texts: list[str]) -> np.ndarray:
+        """Embed texts into L2-normalized float32 rows."""
+        if self._encoder is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError as e:
+                raise RuntimeError(
+                    "Int8EmbeddingCapabilityIndex requires sentence-transformers "
+                    "or an explicit encoder"
+                ) from e
+            model = SentenceTransformer(self._model_name)
+            self._encoder = lambda batch: model.encode(batch, normalize_embeddings=True)
+
+        emb = np.asarray(self._encoder(texts), dtype=np.float32)
+        emb /= np.linalg.norm(emb, axis=1, keepdims=True) + 1e-12
+        return emb
+
+    def _reindex(self) -> None:
+        """Rebuild the quantized embedding matrix."""
+        self._rebuild_lookups()
+        if not self._tools:
+            self._is_fitted = False
+            self._quantized = None
+            self._scale = None
+            return
+
+        texts = [self._corpus_text(tool) for tool in self._tools]
+        self._quantized, self._scale = _quantize_int8(self._encode(texts))
+        self._is_fitted = True
+
+        logger.debug("Embedding capability index rebuilt", tool_count=len(self._tools))
+
+    def _score_queries(self, queries: list[str], top_k: int) -> np.ndarray | None:
+        """Compute approximate cosine similarity for every (tool, query) pair."""
+        if (
+            not queries
+            or not self._is_fitted
+            or self._quantized is None
+            or self._scale is None
+            or top_k <= 0
+        ):
+            return None
+
+        q_quant, q_scale = _quantize_int8(self._encode(queries))
+        q_mat = q_quant.T.astype(np.float32)
+        # NumPy has no int8 x int8 -> int32 matmul, so widen the tool rows a
+        # block at a time rather than copying the whole matrix per query.
+        # float32 sums of int8 products are exact for embeddings up to
+        # ~1000 dimensions (partial sums stay below 2**24).
+        quantized = self._quantized
+        scores: np.ndarray = np.empty((len(quantized), len(queries)), dtype=np.float32)
+        for start in range(0, len(quantized), _INT8_SCORE_BLOCK_ROWS):
+            stop = start + _INT8_SCORE_BLOCK_ROWS
+            np.matmul(quantized[start:stop].astype(np.float32), q_mat, out=scores[start:stop])
+        scores *= np.outer(self._scale, q_scale)
+        return scores
 
 
 class HybridCapabilityIndex(CapabilityIndex):
@@ -206,8 +458,15 @@ class HybridCapabilityIndex(CapabilityIndex):
             tools: Initial tools
             always_include: Tool names that should always be included in results
         """
+        # Set before the base initializer, which reindexes any initial tools
+        self._always_include: frozenset[str] = frozenset(always_include or [])
+        self._priority_tools: list[ToolSpec] = []
         super().__init__(tools)
-        self._always_include = set(always_include or [])
+
+    def _reindex(self) -> None:
+        """Rebuild the TF-IDF index and the priority tool list."""
+        super()._reindex()
+        self._priority_tools = [t for t in self._tools if t.name in self._always_include]
 
     def search(self, query: str, top_k: int = 12) -> list[CapabilityHit]:
         """
@@ -216,18 +475,27 @@ class HybridCapabilityIndex(CapabilityIndex):
         Priority tools are always included at the start of results,
         followed by query-matched tools up to top_k total.
         """
-        # Get priority tools
-        priority_results = []
-        for tool in self._tools:
-            if tool.name in self._always_include:
-                priority_results.append(CapabilityHit(tool=tool, score=1.0))
-
-        # Get search results
+        fetch_k = max(top_k, len(self._priority_tools))
+        return self._with_priority_tools(super().search(query, top_k=fetch_k), top_k)
+
+    def search_batch(self, queries: list[str], top_k: int = 12) -> list[list[CapabilityHit]]:
+        """Batched search with the same priority tool inclusion as search()."""
+        fetch_k = max(top_k, len(self._priority_tools))
+        return [
+            self._with_priority_tools(hits, top_k)
+            for hits in super().search_batch(queries, top_k=fetch_k)
+        ]
+
+    def _with_priority_tools(
+        self,
+        search_results: list[CapabilityHit],
+        top_k: int,
+    ) -> list[CapabilityHit]:
+        """Put priority tools first, then query matches up to top_k total."""
+        priority_results = [CapabilityHit(tool=t, score=1.0) for t in self._priority_tools]
         remaining_k = max(0, top_k - len(priority_results))
-        search_results = super().search(query, top_k=remaining_k + len(priority_results))
 
         # Merge, avoiding duplicates
-        priority_names = {r.tool.name for r in priority_results}
-        filtered_search = [r for r in search_results if r.tool.name not in priority_names]
+        filtered_search = [r for r in search_results if r.tool.name not in self._always_include]
 
         return priority_results + filtered_search[:remaining_k]
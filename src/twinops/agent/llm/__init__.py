@@ -2,11 +2,14 @@
 
 from twinops.agent.llm.base import LlmClient, LlmResponse, Message, ToolCall
 from twinops.agent.llm.factory import create_llm_client
+from twinops.agent.llm.rules import EchoClient, RulesBasedClient
 
 __all__ = [
+    "EchoClient",
     "LlmClient",
     "LlmResponse",
     "Message",
+    "RulesBasedClient",
     "ToolCall",
     "create_llm_client",
 ]
@@ -1,7 +1,9 @@
 """Base classes for LLM integration."""
 
+import asyncio
 import time
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Literal
@@ -11,7 +13,7 @@ from twinops.common.logging import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Chat message."""
 
@@ -21,7 +23,7 @@ class Message:
     name: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """LLM tool call request."""
 
@@ -30,7 +32,7 @@ class ToolCall:
     arguments: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class LlmResponse:
     """Response from LLM."""
 
@@ -63,6 +65,62 @@ class LlmClient(ABC):
         """
         pass
 
+    async def stream_chat(
+        self,
+        messages: list[Message],
+        tools: list[dict[str, Any]] | None = None,
+        system: str | None = None,
+    ) -> AsyncIterator[LlmResponse]:
+        """
+        Stream a chat completion as incremental responses.
+
+        Text arrives as content deltas and tool calls as soon as they are
+        complete; the final item carries the finish reason and usage.
+        Clients without native streaming yield their full response once.
+
+        Args:
+            messages: Conversation history
+            tools: Available tools in LLM format
+            system: System prompt
+
+        Yields:
+            Partial LlmResponse objects
+        """
+        yield await self.chat(messages, tools, system)
+
+    async def chat_many(
+        self,
+        requests: list[tuple[list[Message], list[dict[str, Any]] | None, str | None]],
+        *,
+        max_concurrency: int = 8,
+    ) -> list[LlmResponse]:
+        """
+        Send several independent chat requests concurrently.
+
+        Args:
+            requests: (messages, tools, system) tuples, one per request
+            max_concurrency: Maximum requests in flight at once
+
+        Returns:
+            Responses in the same order as ``requests``
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _one(
+            request: tuple[list[Message], list[dict[str, Any]] | None, str | None],
+        ) -> LlmResponse:
+            async with semaphore:
+                return await self.chat(*request)
+
+        return list(await asyncio.gather(*(_one(request) for request in requests)))
+
+    async def warm_up(self) -> None:
+        """
+        Open connections ahead of the first chat.
+
+        Called once at startup; must not raise. No-op by default.
+        """
+
     @abstractmethod
     async def close(self) -> None:
         """Clean up resources."""
@@ -112,15 +170,16 @@ class LlmCircuitBreaker:
         self._failure_count = 0
         self._success_count = 0
         self._last_failure_time: float = 0
+        # Monotonic deadline after which an open circuit may go half-open
+        self._open_deadline: float = 0.0
         self._half_open_calls = 0
 
     @property
     def state(self) -> LlmCircuitState:
         """Get current circuit state, transitioning if needed."""
-        if (
-            self._state == LlmCircuitState.OPEN
-            and time.time() - self._last_failure_time > self._recovery_timeout
-        ):
+        # Only an open circuit needs the clock; closed/half-open are plain reads.
+        # Transitions happen synchronously on the event loop, so no lock is needed.
+        if self._state is LlmCircuitState.OPEN and time.monotonic() >= self._open_deadline:
             logger.info("LLM circuit breaker transitioning to half-open")
             self._state = LlmCircuitState.HALF_OPEN
             self._half_open_calls = 0
@@ -167,6 +226,9 @@ class LlmCircuitBreaker:
             )
             self._state = LlmCircuitState.OPEN
 
+        if self._state == LlmCircuitState.OPEN:
+            self._open_deadline = time.monotonic() + self._recovery_timeout
+
     def is_open(self) -> bool:
         """Check if circuit is open."""
         return self.state == LlmCircuitState.OPEN
@@ -229,26 +291,28 @@ class ResilientLlmClient(LlmClient):
 
         If circuit is open and fallback is available, uses fallback.
         """
+        cb = self._circuit_breaker
+        state = cb.state
+
         # Check if we should use fallback
-        if self._circuit_breaker.is_open():
+        if state is LlmCircuitState.OPEN:
             if self._fallback:
                 if not self._using_fallback:
                     logger.warning(
                         "LLM circuit open, switching to fallback client",
-                        circuit_state=self._circuit_breaker.state.value,
+                        circuit_state=state.value,
                     )
                     self._using_fallback = True
                 return await self._fallback.chat(messages, tools, system)
             else:
                 raise LlmCircuitBreakerOpen(
-                    f"LLM circuit breaker is open, retry after "
-                    f"{self._circuit_breaker._recovery_timeout}s"
+                    f"LLM circuit breaker is open, retry after {cb._recovery_timeout}s"
                 )
 
         # Try primary client
         try:
             response = await self._primary.chat(messages, tools, system)
-            self._circuit_breaker.record_success()
+            cb.record_success()
 
             # If we were using fallback, switch back
             if self._using_fallback:
@@ -261,18 +325,22 @@ class ResilientLlmClient(LlmClient):
             logger.warning(
                 "LLM API call failed",
                 error=str(e),
-                failure_count=self._circuit_breaker._failure_count + 1,
+                failure_count=cb._failure_count + 1,
             )
-            self._circuit_breaker.record_failure()
+            cb.record_failure()
 
             # If fallback available and circuit just opened, use it
-            if self._fallback and self._circuit_breaker.is_open():
+            if self._fallback and cb.state is LlmCircuitState.OPEN:
                 logger.warning("LLM circuit opened, using fallback client")
                 self._using_fallback = True
                 return await self._fallback.chat(messages, tools, system)
 
             raise
 
+    async def warm_up(self) -> None:
+        """Warm the primary client (the fallback is local)."""
+        await self._primary.warm_up()
+
     async def close(self) -> None:
         """Close both primary and fallback clients."""
         await self._primary.close()
@@ -54,6 +54,11 @@ def create_llm_client(
             model=settings.llm_model,
             max_tokens=settings.llm_max_tokens,
             timeout=settings.llm_request_timeout,
+            shared=True,
+            response_cache_size=settings.llm_response_cache_size,
+            semantic_cache_size=settings.llm_semantic_cache_size,
+            semantic_cache_threshold=settings.llm_semantic_cache_threshold,
+            prompt_cache=settings.llm_prompt_cache,
         )
         logger.info("Created Anthropic LLM client", model=settings.llm_model)
 
@@ -65,6 +70,10 @@ def create_llm_client(
             model=settings.llm_model,
             max_tokens=settings.llm_max_tokens,
             timeout=settings.llm_request_timeout,
+            shared=True,
+            response_cache_size=settings.llm_response_cache_size,
+            semantic_cache_size=settings.llm_semantic_cache_size,
+            semantic_cache_threshold=settings.llm_semantic_cache_threshold,
         )
         logger.info("Created OpenAI LLM client", model=settings.llm_model)
 
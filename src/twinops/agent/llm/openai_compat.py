@@ -1,13 +1,259 @@
 """OpenAI and Anthropic compatible LLM clients."""
 
+import asyncio
+import copy
+import hashlib
 import json
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
 from typing import Any
 
+import numpy as np
+import orjson
+
 from twinops.agent.llm.base import LlmClient, LlmResponse, Message, ToolCall
 from twinops.common.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Tool-argument decoder; orjson.JSONDecodeError subclasses json.JSONDecodeError
+_json_loads: Callable[[str], Any] = orjson.loads
+
+# Provider SDK modules, imported on first client construction and then reused
+_anthropic: Any = None
+_openai: Any = None
+
+
+def _anthropic_sdk() -> Any:
+    """Return the anthropic module, importing it on first use."""
+    global _anthropic
+    if _anthropic is None:
+        import anthropic
+
+        _anthropic = anthropic
+    return _anthropic
+
+
+def _openai_sdk() -> Any:
+    """Return the openai module, importing it on first use."""
+    global _openai
+    if _openai is None:
+        import openai
+
+        _openai = openai
+    return _openai
+
+
+# SDK clients shared across LlmClient instances, per event loop (an SDK client's
+# httpx pool is bound to the loop that first used it) and keyed by
+# (provider, api_key, timeout), so repeated factory calls on one loop reuse the
+# same connection pool and warm TLS sessions.
+_shared_sdk_clients: dict[asyncio.AbstractEventLoop, dict[tuple[str, str, float], Any]] = {}
+_shared_sdk_lock = threading.Lock()
+
+
+def _get_shared_sdk_client(
+    provider: str,
+    api_key: str,
+    timeout: float,
+    create: Callable[[], Any],
+) -> Any:
+    """Return the running loop's pooled SDK client for a provider/credential pair."""
+    loop = asyncio.get_running_loop()
+    key = (provider, api_key, timeout)
+    with _shared_sdk_lock:
+        # Pools of loops closed without close_shared_clients() can never be used
+        # again; drop them so they are not reused or kept alive
+        for stale in [other for other in _shared_sdk_clients if other.is_closed()]:
+            del _shared_sdk_clients[stale]
+        pool = _shared_sdk_clients.setdefault(loop, {})
+        client = pool.get(key)
+        if client is None:
+            client = create()
+            pool[key] = client
+        return client
+
+
+# Keep idle provider connections for two minutes (httpx defaults to 5s) so chats
+# spaced further apart than that still reuse a warm TLS connection
+_KEEPALIVE_EXPIRY_SECONDS = 120.0
+_WARM_UP_TIMEOUT_SECONDS = 5.0
+
+
+def _pooled_http_client(sdk: Any) -> Any:
+    """Build the SDK's default httpx client with a long keep-alive expiry."""
+    import httpx
+
+    limits = sdk.DEFAULT_CONNECTION_LIMITS
+    return sdk.DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=_KEEPALIVE_EXPIRY_SECONDS,
+        )
+    )
+
+
+async def _warm_up_sdk_client(provider: str, client: Any) -> None:
+    """Open a pooled connection with a free models listing request."""
+    try:
+        # Fail fast: an unreachable provider must not hold up startup
+        await client.with_options(max_retries=0, timeout=_WARM_UP_TIMEOUT_SECONDS).models.list()
+    except Exception as e:
+        logger.warning("LLM warm-up request failed", provider=provider, error=str(e))
+    else:
+        logger.debug("LLM client warmed up", provider=provider)
+
+
+def _decode_tool_arguments(args: Any, tool_name: str, tool_call_id: str) -> Any:
+    """Decode an OpenAI tool call's JSON argument string (invalid JSON -> {})."""
+    if not isinstance(args, str):
+        return args
+    if args in ("", "{}"):
+        # No-argument tools are the common case; skip the parser entirely
+        return {}
+    try:
+        return _json_loads(args)
+    except json.JSONDecodeError:
+        logger.warning(
+            "Invalid tool arguments JSON from OpenAI",
+            tool_name=tool_name,
+            tool_call_id=tool_call_id,
+        )
+        return {}
+
+
+class _ResponseCache:
+    """Bounded LRU cache of LLM responses keyed by a hash of the request."""
+
+    def __init__(self, max_entries: int):
+        self._max_entries = max_entries
+        self._entries: OrderedDict[bytes, LlmResponse] = OrderedDict()
+
+    @staticmethod
+    def key(request: dict[str, Any]) -> bytes:
+        """Hash the canonical JSON form of a request."""
+        canonical = json.dumps(request, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key: bytes) -> LlmResponse | None:
+        """Return a copy of the cached response, if any."""
+        response = self._entries.get(key)
+        if response is None:
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(response)
+
+    def put(self, key: bytes, response: LlmResponse) -> None:
+        """Store a copy of a response, evicting the least recently used entry."""
+        self._entries[key] = copy.deepcopy(response)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+class _SemanticResponseCache:
+    """
+    Cache of text-only LLM responses matched by embedding similarity.
+
+    Requests are scoped by an exact hash of everything except the final
+    user message (model, system prompt, tools, earlier turns); within a
+    scope, the final user message is embedded and the most similar cached
+    message is reused when its cosine similarity reaches the threshold.
+    Responses containing tool calls are never stored, since replaying an
+    action for a paraphrased request is not safe.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        threshold: float,
+        encoder: Callable[[list[str]], np.ndarray] | None = None,
+        model_name: str = "all-MiniLM-L6-v2",
+    ):
+        self._max_entries = max_entries
+        self._threshold = threshold
+        self._encoder = encoder
+        self._model_name = model_name
+        # Encoding runs in worker threads; concurrent first requests must not
+        # each load the model
+        self._encoder_lock = threading.Lock()
+        self._entries: OrderedDict[int, tuple[bytes, np.ndarray, LlmResponse]] = OrderedDict()
+        self._next_id = 0
+
+    def _get_encoder(self) -> Callable[[list[str]], np.ndarray]:
+        """Return the encoder, loading the default model on first use."""
+        encoder = self._encoder
+        if encoder is not None:
+            return encoder
+        with self._encoder_lock:
+            if self._encoder is None:
+                try:
+                    from sentence_transformers import SentenceTransformer
+                except ImportError as e:
+                    raise RuntimeError(
+                        "Semantic response cache requires sentence-transformers "
+                        "or an explicit encoder"
+                    ) from e
+                model = SentenceTransformer(self._model_name)
+                self._encoder = lambda batch: model.encode(batch, normalize_embeddings=True)
+            return self._encoder
+
+    def _encode(self, text: str) -> np.ndarray:
+        """Embed one text into an L2-normalized float32 vector."""
+        vector = np.asarray(self._get_encoder()([text]), dtype=np.float32)[0]
+        return vector / (np.linalg.norm(vector) + 1e-12)
+
+    def request_key(self, request: dict[str, Any]) -> tuple[bytes, np.ndarray] | None:
+        """Return (scope hash, final user message embedding), or None if not cacheable."""
+        messages = request.get("messages") or []
+        last = messages[-1] if messages else None
+        if not last or last.get("role") != "user" or not isinstance(last.get("content"), str):
+            return None
+        scope = _ResponseCache.key({**request, "messages": messages[:-1]})
+        return scope, self._encode(last["content"])
+
+    def get(self, key: tuple[bytes, np.ndarray]) -> LlmResponse | None:
+        """Return a copy of the closest cached response above the threshold."""
+        scope, vector = key
+        candidates = [
+            (entry_id, emb) for entry_id, (s, emb, _) in self._entries.items() if s == scope
+        ]
+        if not candidates:
+            return None
+        scores = np.stack([emb for _, emb in candidates]) @ vector
+        best = int(np.argmax(scores))
+        if scores[best] < self._threshold:
+            return None
+        entry_id = candidates[best][0]
+        self._entries.move_to_end(entry_id)
+        return copy.deepcopy(self._entries[entry_id][2])
+
+    def put(self, key: tuple[bytes, np.ndarray], response: LlmResponse) -> None:
+        """Store a text-only response, evicting the least recently used entry."""
+        if response.tool_calls or not response.content:
+            return
+        scope, vector = key
+        self._entries[self._next_id] = (scope, vector, copy.deepcopy(response))
+        self._next_id += 1
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+async def close_shared_clients() -> None:
+    """
+    Close the running loop's pooled SDK clients.
+
+    Whoever creates clients with ``shared=True`` (including through
+    create_llm_client) owns this cleanup: await it on the same loop before
+    that loop closes. Pools on other loops are left alone.
+    """
+    with _shared_sdk_lock:
+        pool = _shared_sdk_clients.pop(asyncio.get_running_loop(), {})
+    for client in pool.values():
+        await client.close()
+
 
 class AnthropicClient(LlmClient):
     """Anthropic Claude API client."""
@@ -18,6 +264,11 @@ class AnthropicClient(LlmClient):
         model: str = "claude-sonnet-4-20250514",
         max_tokens: int = 4096,
         timeout: float = 30.0,
+        shared: bool = False,
+        response_cache_size: int = 0,
+        semantic_cache_size: int = 0,
+        semantic_cache_threshold: float = 0.92,
+        prompt_cache: bool = False,
     ):
         """
         Initialize Anthropic client.
@@ -27,47 +278,67 @@ class AnthropicClient(LlmClient):
             model: Model identifier
             max_tokens: Maximum tokens in response
             timeout: Request timeout in seconds
+            shared: Reuse the event loop's pooled SDK client (the caller closes
+                the pool with close_shared_clients)
+            response_cache_size: Cache this many responses to identical requests
+                (0 disables caching; only useful for deterministic generation)
+            semantic_cache_size: Cache this many text-only responses for reuse on
+                paraphrased requests (0 disables; needs sentence-transformers)
+            semantic_cache_threshold: Minimum cosine similarity for a semantic hit
+            prompt_cache: Mark the system prompt and tool definitions as cacheable
+                prefixes (Anthropic prompt caching)
         """
-        import anthropic
+        anthropic = _anthropic_sdk()
 
-        self._client = anthropic.AsyncAnthropic(
-            api_key=api_key,
-            timeout=timeout,
-        )
+        def create() -> Any:
+            return anthropic.AsyncAnthropic(
+                api_key=api_key,
+                timeout=timeout,
+                http_client=_pooled_http_client(anthropic),
+            )
+
+        self._shared_key = ("anthropic", api_key, timeout)
+        self._create_sdk_client = create
+        # Shared SDK clients are looked up per event loop when first used
+        self._own_client: Any = None if shared else create()
         self._model = model
         self._max_tokens = max_tokens
+        self._prompt_cache = prompt_cache
+        self._cache = _ResponseCache(response_cache_size) if response_cache_size > 0 else None
+        self._semantic_cache = (
+            _SemanticResponseCache(semantic_cache_size, semantic_cache_threshold)
+            if semantic_cache_size > 0
+            else None
+        )
 
-    async def chat(
+    @property
+    def _client(self) -> Any:
+        """The SDK client: this instance's own, or the running loop's pooled one."""
+        if self._own_client is not None:
+            return self._own_client
+        return _get_shared_sdk_client(*self._shared_key, self._create_sdk_client)
+
+    def _build_request(
         self,
         messages: list[Message],
-        tools: list[dict[str, Any]] | None = None,
-        system: str | None = None,
-    ) -> LlmResponse:
-        """Send chat completion request to Anthropic."""
-        # Convert messages to Anthropic format
-        anthropic_messages = []
-        for msg in messages:
-            if msg.role == "system":
-                continue  # Handled separately
-            anthropic_messages.append(
-                {
-                    "role": msg.role,
-                    "content": msg.content,
-                }
-            )
+        tools: list[dict[str, Any]] | None,
+        system: str | None,
+    ) -> dict[str, Any]:
+        """Convert messages and tools into Messages API request parameters."""
+        # Convert messages to Anthropic format (system prompt is sent separately)
+        anthropic_messages = [
+            {"role": msg.role, "content": msg.content} for msg in messages if msg.role != "system"
+        ]
 
         # Convert tools to Anthropic format
-        anthropic_tools = None
-        if tools:
-            anthropic_tools = []
-            for t in tools:
-                anthropic_tools.append(
-                    {
-                        "name": t["name"],
-                        "description": t.get("description", ""),
-                        "input_schema": t.get("input_schema", t.get("parameters", {})),
-                    }
-                )
+        anthropic_tools = [
+            {
+                "name": t["name"],
+                "description": t.get("description", ""),
+                "input_schema": t.get("input_schema", t.get("parameters", {})),
+            }
+            for t in tools or ()
+        ]
 
         # Build request
         kwargs: dict[str, Any] = {
@@ -76,32 +347,66 @@ class AnthropicClient(LlmClient):
             "messages": anthropic_messages,
         }
 
-        if system:
+        if self._prompt_cache:
+            # Cache breakpoints: the prefix up to each marked block is reused
+            # across requests (tools are ordered before the system prompt)
+            if anthropic_tools:
+                anthropic_tools[-1]["cache_control"] = {"type": "ephemeral"}
+            if system:
+                kwargs["system"] = [
+                    {"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}
+                ]
+        elif system:
             kwargs["system"] = system
 
         if anthropic_tools:
             kwargs["tools"] = anthropic_tools
 
+        return kwargs
+
+    async def chat(
+        self,
+        messages: list[Message],
+        tools: list[dict[str, Any]] | None = None,
+        system: str | None = None,
+    ) -> LlmResponse:
+        """Send chat completion request to Anthropic."""
+        kwargs = self._build_request(messages, tools, system)
+
+        cache_key = None
+        if self._cache is not None:
+            cache_key = self._cache.key(kwargs)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        semantic_key = None
+        if self._semantic_cache is not None:
+            # Embedding is CPU-bound model inference; keep it off the event loop
+            semantic_key = await asyncio.to_thread(self._semantic_cache.request_key, kwargs)
+            if semantic_key is not None:
+                cached = self._semantic_cache.get(semantic_key)
+                if cached is not None:
+                    return cached
+
         # Send request
         response = await self._client.messages.create(**kwargs)
 
-        # Parse response
-        content = None
-        tool_calls = []
-
-        for block in response.content:
-            if block.type == "text":
-                content = block.text
-            elif block.type == "tool_use":
-                tool_calls.append(
-                    ToolCall(
-                        id=block.id,
-                        name=block.name,
-                        arguments=block.input if isinstance(block.input, dict) else {},
-                    )
-                )
+        # Parse response (the last text block wins)
+        blocks = response.content
+        texts = [block.text for block in blocks if block.type == "text"]
+        content = texts[-1] if texts else None
+        tool_calls = [
+            ToolCall(
+                id=block.id,
+                name=block.name,
+                arguments=block.input if isinstance(block.input, dict) else {},
+            )
+            for block in blocks
+            if block.type == "tool_use"
+        ]
 
-        return LlmResponse(
+        result = LlmResponse(
             content=content,
             tool_calls=tool_calls,
             finish_reason=response.stop_reason,
@@ -110,10 +415,55 @@ class AnthropicClient(LlmClient):
                 "output_tokens": response.usage.output_tokens,
             },
         )
+        if self._cache is not None and cache_key is not None:
+            self._cache.put(cache_key, result)
+        if self._semantic_cache is not None and semantic_key is not None:
+            self._semantic_cache.put(semantic_key, result)
+        return result
+
+    async def stream_chat(
+        self,
+        messages: list[Message],
+        tools: list[dict[str, Any]] | None = None,
+        system: str | None = None,
+    ) -> AsyncIterator[LlmResponse]:
+        """Stream a chat completion from Anthropic via the Messages streaming API."""
+        kwargs = self._build_request(messages, tools, system)
+        async with self._client.messages.stream(**kwargs) as stream:
+            async for event in stream:
+                if event.type == "text":
+                    yield LlmResponse(content=event.text)
+                elif event.type == "content_block_stop" and event.content_block.type == "tool_use":
+                    block = event.content_block
+                    yield LlmResponse(
+                        content=None,
+                        tool_calls=[
+                            ToolCall(
+                                id=block.id,
+                                name=block.name,
+                                arguments=block.input if isinstance(block.input, dict) else {},
+                            )
+                        ],
+                    )
+            final = await stream.get_final_message()
+
+        yield LlmResponse(
+            content=None,
+            finish_reason=final.stop_reason,
+            usage={
+                "input_tokens": final.usage.input_tokens,
+                "output_tokens": final.usage.output_tokens,
+            },
+        )
+
+    async def warm_up(self) -> None:
+        """Open a connection to the Anthropic API."""
+        await _warm_up_sdk_client("anthropic", self._client)
 
     async def close(self) -> None:
-        """Close the client."""
-        await self._client.close()
+        """Close the client (pooled SDK clients stay open for reuse)."""
+        if self._own_client is not None:
+            await self._own_client.close()
 
 
 class OpenAIClient(LlmClient):
@@ -125,6 +475,10 @@ class OpenAIClient(LlmClient):
         model: str = "gpt-4-turbo-preview",
         max_tokens: int = 4096,
         timeout: float = 30.0,
+        shared: bool = False,
+        response_cache_size: int = 0,
+        semantic_cache_size: int = 0,
+        semantic_cache_threshold: float = 0.92,
     ):
         """
         Initialize OpenAI client.
@@ -134,52 +488,66 @@ class OpenAIClient(LlmClient):
             model: Model identifier
             max_tokens: Maximum tokens in response
             timeout: Request timeout in seconds
+            shared: Reuse the event loop's pooled SDK client (the caller closes
+                the pool with close_shared_clients)
+            response_cache_size: Cache this many responses to identical requests
+                (0 disables caching; only useful for deterministic generation)
+            semantic_cache_size: Cache this many text-only responses for reuse on
+                paraphrased requests (0 disables; needs sentence-transformers)
+            semantic_cache_threshold: Minimum cosine similarity for a semantic hit
         """
-        import openai
+        openai = _openai_sdk()
 
-        self._client = openai.AsyncOpenAI(
-            api_key=api_key,
-            timeout=timeout,
-        )
+        def create() -> Any:
+            return openai.AsyncOpenAI(
+                api_key=api_key,
+                timeout=timeout,
+                http_client=_pooled_http_client(openai),
+            )
+
+        self._shared_key = ("openai", api_key, timeout)
+        self._create_sdk_client = create
+        # Shared SDK clients are looked up per event loop when first used
+        self._own_client: Any = None if shared else create()
         self._model = model
         self._max_tokens = max_tokens
+        self._cache = _ResponseCache(response_cache_size) if response_cache_size > 0 else None
+        self._semantic_cache = (
+            _SemanticResponseCache(semantic_cache_size, semantic_cache_threshold)
+            if semantic_cache_size > 0
+            else None
+        )
 
-    async def chat(
+    @property
+    def _client(self) -> Any:
+        """The SDK client: this instance's own, or the running loop's pooled one."""
+        if self._own_client is not None:
+            return self._own_client
+        return _get_shared_sdk_client(*self._shared_key, self._create_sdk_client)
+
+    def _build_request(
         self,
         messages: list[Message],
-        tools: list[dict[str, Any]] | None = None,
-        system: str | None = None,
-    ) -> LlmResponse:
-        """Send chat completion request to OpenAI."""
+        tools: list[dict[str, Any]] | None,
+        system: str | None,
+    ) -> dict[str, Any]:
+        """Convert messages and tools into Chat Completions request parameters."""
         # Convert messages to OpenAI format
-        openai_messages = []
-
-        if system:
-            openai_messages.append({"role": "system", "content": system})
-
-        for msg in messages:
-            openai_messages.append(
-                {
-                    "role": msg.role,
-                    "content": msg.content,
-                }
-            )
+        openai_messages = [{"role": "system", "content": system}] if system else []
+        openai_messages += [{"role": msg.role, "content": msg.content} for msg in messages]
 
         # Convert tools to OpenAI format
-        openai_tools = None
-        if tools:
-            openai_tools = []
-            for t in tools:
-                openai_tools.append(
-                    {
-                        "type": "function",
-                        "function": {
-                            "name": t["name"],
-                            "description": t.get("description", ""),
-                            "parameters": t.get("parameters", t.get("input_schema", {})),
-                        },
-                    }
-                )
+        openai_tools = [
+            {
+                "type": "function",
+                "function": {
+                    "name": t["name"],
+                    "description": t.get("description", ""),
+                    "parameters": t.get("parameters", t.get("input_schema", {})),
+                },
+            }
+            for t in tools or ()
+        ]
 
         # Build request
         kwargs: dict[str, Any] = {
@@ -191,34 +559,49 @@ class OpenAIClient(LlmClient):
         if openai_tools:
             kwargs["tools"] = openai_tools
 
+        return kwargs
+
+    async def chat(
+        self,
+        messages: list[Message],
+        tools: list[dict[str, Any]] | None = None,
+        system: str | None = None,
+    ) -> LlmResponse:
+        """Send chat completion request to OpenAI."""
+        kwargs = self._build_request(messages, tools, system)
+
+        cache_key = None
+        if self._cache is not None:
+            cache_key = self._cache.key(kwargs)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        semantic_key = None
+        if self._semantic_cache is not None:
+            # Embedding is CPU-bound model inference; keep it off the event loop
+            semantic_key = await asyncio.to_thread(self._semantic_cache.request_key, kwargs)
+            if semantic_key is not None:
+                cached = self._semantic_cache.get(semantic_key)
+                if cached is not None:
+                    return cached
+
         # Send request
         response = await self._client.chat.completions.create(**kwargs)
 
         # Parse response
         choice = response.choices[0]
         content = choice.message.content
-        tool_calls = []
-
-        if choice.message.tool_calls:
-            for tc in choice.message.tool_calls:
-                args = tc.function.arguments
-                if isinstance(args, str):
-                    try:
-                        args = json.loads(args)
-                    except json.JSONDecodeError:
-                        logger.warning(
-                            "Invalid tool arguments JSON from OpenAI",
-                            tool_name=tc.function.name,
-                            tool_call_id=tc.id,
-                        )
-                        args = {}
-                tool_calls.append(
-                    ToolCall(
-                        id=tc.id,
-                        name=tc.function.name,
-                        arguments=args,
-                    )
-                )
+        tool_calls = [
+            ToolCall(
+                id=tc.id,
+                name=tc.function.name,
+                arguments=_decode_tool_arguments(
+                    tc.function.arguments, tc.function.name, tc.id
+                ),
+            )
+            for tc in choice.message.tool_calls or ()
+        ]
 
         usage = None
         if response.usage:
@@ -227,13 +610,79 @@ class OpenAIClient(LlmClient):
                 "output_tokens": response.usage.completion_tokens,
             }
 
-        return LlmResponse(
+        result = LlmResponse(
             content=content,
             tool_calls=tool_calls,
             finish_reason=choice.finish_reason,
             usage=usage,
         )
+        if self._cache is not None and cache_key is not None:
+            self._cache.put(cache_key, result)
+        if self._semantic_cache is not None and semantic_key is not None:
+            self._semantic_cache.put(semantic_key, result)
+        return result
+
+    async def stream_chat(
+        self,
+        messages: list[Message],
+        tools: list[dict[str, Any]] | None = None,
+        system: str | None = None,
+    ) -> AsyncIterator[LlmResponse]:
+        """Stream a chat completion from OpenAI (tool calls are emitted once complete)."""
+        kwargs = self._build_request(messages, tools, system)
+        stream = await self._client.chat.completions.create(
+            **kwargs,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+
+        # Tool call fragments by index: [id, name, argument chunks]
+        partial_calls: dict[int, tuple[list[str], list[str]]] = {}
+        finish_reason = None
+        usage = None
+        async for chunk in stream:
+            if chunk.usage:
+                usage = {
+                    "input_tokens": chunk.usage.prompt_tokens,
+                    "output_tokens": chunk.usage.completion_tokens,
+                }
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            if choice.delta.content:
+                yield LlmResponse(content=choice.delta.content)
+            for tc in choice.delta.tool_calls or ():
+                ident, args = partial_calls.setdefault(tc.index, (["", ""], []))
+                if tc.id:
+                    ident[0] = tc.id
+                if tc.function and tc.function.name:
+                    ident[1] = tc.function.name
+                if tc.function and tc.function.arguments:
+                    args.append(tc.function.arguments)
+            if choice.finish_reason:
+                finish_reason = choice.finish_reason
+
+        if partial_calls:
+            yield LlmResponse(
+                content=None,
+                tool_calls=[
+                    ToolCall(
+                        id=call_id,
+                        name=name,
+                        arguments=_decode_tool_arguments("".join(args), name, call_id),
+                    )
+                    for (call_id, name), args in (
+                        partial_calls[index] for index in sorted(partial_calls)
+                    )
+                ],
+            )
+        yield LlmResponse(content=None, finish_reason=finish_reason, usage=usage)
+
+    async def warm_up(self) -> None:
+        """Open a connection to the OpenAI API."""
+        await _warm_up_sdk_client("openai", self._client)
 
     async def close(self) -> None:
-        """Close the client."""
-        await self._client.close()
+        """Close the client (pooled SDK clients stay open for reuse)."""
+        if self._own_client is not None:
+            await self._own_client.close()
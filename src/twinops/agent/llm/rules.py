@@ -1,8 +1,10 @@
 """Rules-based LLM fallback for operation without API keys."""
 
+import itertools
+import os
 import re
-import uuid
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 from twinops.agent.llm.base import LlmClient, LlmResponse, Message, ToolCall
@@ -11,21 +13,54 @@ from twinops.common.logging import get_logger
 logger = get_logger(__name__)
 
 
-# Common prefixes and suffixes to strip from user messages
+# Common polite/request prefixes to strip from user messages
 STRIP_PREFIXES = [
-    r"^(?:please\s+)?(?:can\s+you\s+)?(?:could\s+you\s+)?(?:would\s+you\s+)?",
-    r"^(?:i\s+want\s+(?:you\s+)?to\s+)?",
-    r"^(?:i\s+need\s+(?:you\s+)?to\s+)?",
-    r"^(?:i'd\s+like\s+(?:you\s+)?to\s+)?",
+    r"please\s+",
+    r"can\s+you\s+",
+    r"could\s+you\s+",
+    r"would\s+you\s+",
+    r"i\s+want\s+(?:you\s+)?to\s+",
+    r"i\s+need\s+(?:you\s+)?to\s+",
+    r"i'd\s+like\s+(?:you\s+)?to\s+",
 ]
 
+# All prefixes fused into one anchored alternation so they are stripped in a single pass
+_STRIP_RE = re.compile(r"^(?:" + "|".join(STRIP_PREFIXES) + r")+")
+
+_SIMULATE_RE = re.compile(r"simulate|dry run|test")
+
+# Tool call IDs only need to be unique within a conversation: a counter seeded
+# from os.urandom avoids building a UUID per call
+_call_ids = itertools.count(int.from_bytes(os.urandom(4), "big"))
+
+# Splits identifiers on CamelCase boundaries: "SetHTTPSpeed2" -> Set, HTTP, Speed2
+_WORD_RE = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z0-9]+")
+
 
 def normalize_message(msg: str) -> str:
     """Normalize user message by stripping common prefixes."""
     result = msg.lower().strip()
-    for prefix in STRIP_PREFIXES:
-        result = re.sub(prefix, "", result)
-    return result.strip()
+    return _STRIP_RE.sub("", result, count=1).strip()
+
+
+@lru_cache(maxsize=512)
+def _word_set(name: str) -> frozenset[str]:
+    """Return the lowercase words of a tool name (cached per name)."""
+    return frozenset(word.lower() for word in _WORD_RE.findall(name))
+
+
+# Catalog size from which word matching uses an inverted index instead of a scan
+_INDEXED_MATCH_MIN_TOOLS = 16
+
+
+@lru_cache(maxsize=8)
+def _word_postings(names: tuple[str, ...]) -> dict[str, list[int]]:
+    """Map each tool-name word to the positions of the tools containing it."""
+    postings: dict[str, list[int]] = {}
+    for idx, name in enumerate(names):
+        for word in _word_set(name):
+            postings.setdefault(word, []).append(idx)
+    return postings
 
 
 def fuzzy_match_tool(tool_name: str, available_tools: dict[str, Any]) -> str | None:
@@ -40,28 +75,46 @@ def fuzzy_match_tool(tool_name: str, available_tools: dict[str, Any]) -> str | N
 
     # Case-insensitive match
     tool_lower = tool_name.lower()
-    for name in available_tools:
-        if name.lower() == tool_lower:
+    lowered = [(name, name.lower()) for name in available_tools]
+    for name, name_lower in lowered:
+        if name_lower == tool_lower:
             return name
 
     # Partial match (tool name contains or is contained in available tool)
-    for name in available_tools:
-        name_lower = name.lower()
+    for name, name_lower in lowered:
         if tool_lower in name_lower or name_lower in tool_lower:
             return name
 
     # Word-based match
-    tool_words = set(re.findall(r"[a-z]+", tool_lower))
+    tool_words = _word_set(tool_name)
+    if not tool_words:
+        return None
     best_match = None
     best_score = 0
-    for name in available_tools:
-        name_words = set(re.findall(r"[a-z]+", name.lower()))
-        overlap = len(tool_words & name_words)
-        if overlap > best_score:
-            best_score = overlap
-            best_match = name
-
-    if best_score > 0:
+    if len(available_tools) >= _INDEXED_MATCH_MIN_TOOLS:
+        # Count overlaps from the inverted index, touching only tools that share a
+        # word; ties go to the earliest tool, as in the linear scan below
+        names = tuple(available_tools)
+        postings = _word_postings(names)
+        counts: dict[int, int] = {}
+        for word in tool_words:
+            for idx in postings.get(word, ()):
+                counts[idx] = counts.get(idx, 0) + 1
+        if counts:
+            best_idx = min(counts, key=lambda idx: (-counts[idx], idx))
+            best_score = counts[best_idx]
+            best_match = names[best_idx]
+    else:
+        for name in available_tools:
+            overlap = len(tool_words & _word_set(name))
+            if overlap == len(tool_words):
+                return name
+            if overlap > best_score:
+                best_score = overlap
+                best_match = name
+
+    # Require most words to agree so e.g. StopPump never resolves to StartPump
+    if best_score * 2 > len(tool_words):
         return best_match
 
     return None
@@ -85,85 +138,133 @@ class RulesBasedClient(LlmClient):
     """
 
     # Specific patterns for common operations
-    SPECIFIC_PATTERNS: list[tuple[str, str, Callable[[re.Match[str]], dict[str, Any]]]] = [
+    SPECIFIC_PATTERNS: list[
+        tuple[re.Pattern[str], str, Callable[[re.Match[str]], dict[str, Any]]]
+    ] = [
         # Speed control
         (
-            r"set\s+(?:the\s+)?(?:pump\s+)?speed\s+(?:to\s+)?(\d+(?:\.\d+)?)",
+            re.compile(r"set\s+(?:the\s+)?(?:pump\s+)?speed\s+(?:to\s+)?(\d+(?:\.\d+)?)"),
+            "SetSpeed",
+            lambda m: {"RPM": float(m.group(1))},
+        ),
+        (
+            re.compile(r"change\s+(?:the\s+)?speed\s+(?:to\s+)?(\d+(?:\.\d+)?)"),
             "SetSpeed",
             lambda m: {"RPM": float(m.group(1))},
         ),
         (
-            r"change\s+(?:the\s+)?speed\s+(?:to\s+)?(\d+(?:\.\d+)?)",
+            re.compile(r"speed\s+(?:to\s+)?(\d+(?:\.\d+)?)"),
             "SetSpeed",
             lambda m: {"RPM": float(m.group(1))},
         ),
-        (r"speed\s+(?:to\s+)?(\d+(?:\.\d+)?)", "SetSpeed", lambda m: {"RPM": float(m.group(1))}),
         # Pump control
-        (r"(?:turn\s+on|start|activate|enable)\s+(?:the\s+)?pump", "StartPump", lambda _m: {}),
-        (r"(?:turn\s+off|stop|deactivate|disable)\s+(?:the\s+)?pump", "StopPump", lambda _m: {}),
-        (r"pump\s+(?:on|start)", "StartPump", lambda _m: {}),
-        (r"pump\s+(?:off|stop)", "StopPump", lambda _m: {}),
+        (
+            re.compile(r"(?:turn\s+on|start|activate|enable)\s+(?:the\s+)?pump"),
+            "StartPump",
+            lambda _m: {},
+        ),
+        (
+            re.compile(r"(?:turn\s+off|stop|deactivate|disable)\s+(?:the\s+)?pump"),
+            "StopPump",
+            lambda _m: {},
+        ),
+        (re.compile(r"pump\s+(?:on|start)"), "StartPump", lambda _m: {}),
+        (re.compile(r"pump\s+(?:off|stop)"), "StopPump", lambda _m: {}),
         # Temperature control
         (
-            r"set\s+(?:the\s+)?temp(?:erature)?\s+(?:to\s+)?(\d+(?:\.\d+)?)",
+            re.compile(r"set\s+(?:the\s+)?temp(?:erature)?\s+(?:to\s+)?(\d+(?:\.\d+)?)"),
             "SetTemperature",
             lambda m: {"Temperature": float(m.group(1))},
         ),
         (
-            r"change\s+(?:the\s+)?temp(?:erature)?\s+(?:to\s+)?(\d+(?:\.\d+)?)",
+            re.compile(r"change\s+(?:the\s+)?temp(?:erature)?\s+(?:to\s+)?(\d+(?:\.\d+)?)"),
             "SetTemperature",
             lambda m: {"Temperature": float(m.group(1))},
         ),
         (
-            r"temp(?:erature)?\s+(?:to\s+)?(\d+(?:\.\d+)?)",
+            re.compile(r"temp(?:erature)?\s+(?:to\s+)?(\d+(?:\.\d+)?)"),
             "SetTemperature",
             lambda m: {"Temperature": float(m.group(1))},
         ),
         # Status queries
         (
-            r"(?:get|show|check|display|what(?:'s|\s+is)?)\s+(?:the\s+)?(?:current\s+)?status",
+            re.compile(
+                r"(?:get|show|check|display|what(?:'s|\s+is)?)\s+(?:the\s+)?(?:current\s+)?status"
+            ),
             "GetStatus",
             lambda _m: {},
         ),
-        (r"status\s+(?:report|check|info)", "GetStatus", lambda _m: {}),
-        (r"how\s+(?:is|are)\s+(?:things|it)", "GetStatus", lambda _m: {}),
+        (re.compile(r"status\s+(?:report|check|info)"), "GetStatus", lambda _m: {}),
+        (re.compile(r"how\s+(?:is|are)\s+(?:things|it)"), "GetStatus", lambda _m: {}),
         # Temperature reading
         (
-            r"(?:read|get|show|what(?:'s|\s+is)?)\s+(?:the\s+)?(?:current\s+)?temp(?:erature)?",
+            re.compile(
+                r"(?:read|get|show|what(?:'s|\s+is)?)\s+(?:the\s+)?(?:current\s+)?temp(?:erature)?"
+            ),
             "ReadTemperature",
             lambda _m: {},
         ),
-        (r"temp(?:erature)?\s+reading", "ReadTemperature", lambda _m: {}),
+        (re.compile(r"temp(?:erature)?\s+reading"), "ReadTemperature", lambda _m: {}),
         # Emergency
-        (r"emergency\s+(?:stop|shutdown|halt)", "EmergencyStop", lambda _m: {}),
-        (r"e-stop|estop", "EmergencyStop", lambda _m: {}),
-        (r"(?:immediate(?:ly)?|urgent)\s+stop", "EmergencyStop", lambda _m: {}),
+        (re.compile(r"emergency\s+(?:stop|shutdown|halt)"), "EmergencyStop", lambda _m: {}),
+        (re.compile(r"e-stop|estop"), "EmergencyStop", lambda _m: {}),
+        (re.compile(r"(?:immediate(?:ly)?|urgent)\s+stop"), "EmergencyStop", lambda _m: {}),
     ]
 
+    # Every specific pattern as a lookahead from the start of the message, in
+    # list order: one match() finds the highest-priority pattern occurring
+    # anywhere, named p<index> so m.lastgroup says which one it was
+    _SPECIFIC_FUSED = re.compile(
+        "|".join(
+            f"(?=.*?(?P<p{idx}>{pattern.pattern}))"
+            for idx, (pattern, _, _) in enumerate(SPECIFIC_PATTERNS)
+        ),
+        re.DOTALL,
+    )
+
     # Generic patterns for any tool
-    GENERIC_PATTERNS: list[tuple[str, Callable[[re.Match[str]], tuple[str, dict[str, Any]]]]] = [
+    GENERIC_PATTERNS: list[
+        tuple[re.Pattern[str], Callable[[re.Match[str]], tuple[str, dict[str, Any]]]]
+    ] = [
         # "call <operation>" or "run <operation>" or "execute <operation>"
-        (r"(?:call|run|execute|invoke)\s+(\w+)", lambda m: (m.group(1), {})),
+        (re.compile(r"(?:call|run|execute|invoke)\s+(\w+)"), lambda m: (m.group(1), {})),
         # "set <property> to <value>"
         (
-            r"set\s+(\w+)\s+(?:to\s+)?(\d+(?:\.\d+)?)",
+            re.compile(r"set\s+(\w+)\s+(?:to\s+)?(\d+(?:\.\d+)?)"),
             lambda m: (f"Set{m.group(1).title()}", {m.group(1).title(): float(m.group(2))}),
         ),
         # "get <property>" or "read <property>"
-        (r"(?:get|read|show)\s+(\w+)", lambda m: (f"Read{m.group(1).title()}", {})),
+        (re.compile(r"(?:get|read|show)\s+(\w+)"), lambda m: (f"Read{m.group(1).title()}", {})),
     ]
 
     def __init__(self) -> None:
         """Initialize the rules-based client."""
+        # (tool names, name -> tool map, no-match reply) for the most recent
+        # tools; keyed on the names since callers build a new list per request
+        self._tools_cache: tuple[tuple[str, ...], dict[str, Any], str] = (
+            (),
+            {},
+            self._no_match_reply({}),
+        )
         logger.info("Using rules-based LLM client (no API key)")
 
+    @staticmethod
+    def _no_match_reply(available_tools: dict[str, Any]) -> str:
+        """Build the help text returned when no pattern matches."""
+        available = ", ".join(sorted(available_tools)) if available_tools else "none loaded"
+        return (
+            f"I couldn't understand that command. Available operations: {available}. "
+            "Try commands like 'start pump', 'set speed to 1200', 'get status', or 'stop pump'."
+        )
+
     def _extract_simulate_flag(self, msg: str) -> bool:
         """Extract simulation flag from message."""
+        lowered = msg.lower()
         # Explicit simulate=false overrides
-        if "simulate=false" in msg.lower() or "real" in msg.lower():
+        if "simulate=false" in lowered or "real" in lowered:
             return False
         # Check for simulate request
-        return "simulate" in msg.lower() or "dry run" in msg.lower() or "test" in msg.lower()
+        return _SIMULATE_RE.search(lowered) is not None
 
     async def chat(
         self,
@@ -202,13 +303,30 @@ class RulesBasedClient(LlmClient):
         # Check for simulation flag
         simulate = self._extract_simulate_flag(user_msg)
 
-        # Build available tools map
-        available_tools = {t["name"]: t for t in (tools or [])}
+        # Build available tools map (reused while the caller offers the same tools)
+        tool_names = tuple(t["name"] for t in tools) if tools else ()
+        if self._tools_cache[0] != tool_names:
+            tool_map = {t["name"]: t for t in (tools or [])}
+            self._tools_cache = (tool_names, tool_map, self._no_match_reply(tool_map))
+        available_tools = self._tools_cache[1]
         tool_calls = []
 
-        # Try specific patterns first (highest priority)
-        for pattern, tool_name, extractor in self.SPECIFIC_PATTERNS:
-            match = re.search(pattern, normalized)
+        # Try specific patterns first (highest priority), in list order. The
+        # fused scan names the first one that occurs; later ones are only
+        # searched if that pattern's tool is not available.
+        specific = self.SPECIFIC_PATTERNS
+        first, first_pos = len(specific), 0
+        fused = self._SPECIFIC_FUSED.match(normalized)
+        if fused is not None and fused.lastgroup is not None:
+            first, first_pos = int(fused.lastgroup[1:]), fused.start(fused.lastgroup)
+        for idx in range(first, len(specific)):
+            pattern, tool_name, extractor = specific[idx]
+            # Re-match the winner where it was found to get its own groups
+            match = (
+                pattern.match(normalized, first_pos)
+                if idx == first
+                else pattern.search(normalized)
+            )
             if match:
                 # Check if tool exists (with fuzzy matching)
                 matched_tool = fuzzy_match_tool(tool_name, available_tools)
@@ -219,7 +337,7 @@ class RulesBasedClient(LlmClient):
 
                     tool_calls.append(
                         ToolCall(
-                            id=f"call_{uuid.uuid4().hex[:8]}",
+                            id=f"call_{next(_call_ids) & 0xFFFFFFFF:08x}",
                             name=matched_tool,
                             arguments=args,
                         )
@@ -229,7 +347,7 @@ class RulesBasedClient(LlmClient):
         # If no specific pattern matched, try generic patterns
         if not tool_calls:
             for pattern, generic_extractor in self.GENERIC_PATTERNS:
-                match = re.search(pattern, normalized)
+                match = pattern.search(normalized)
                 if match:
                     tool_name, args = generic_extractor(match)
                     # Try fuzzy matching for the extracted tool name
@@ -242,7 +360,7 @@ class RulesBasedClient(LlmClient):
 
                         tool_calls.append(
                             ToolCall(
-                                id=f"call_{uuid.uuid4().hex[:8]}",
+                                id=f"call_{next(_call_ids) & 0xFFFFFFFF:08x}",
                                 name=matched_tool,
                                 arguments=args,
                             )
@@ -256,13 +374,9 @@ class RulesBasedClient(LlmClient):
                 finish_reason="tool_use",
             )
 
-        # No pattern matched - provide helpful response
-        available = ", ".join(sorted(available_tools.keys())) if available_tools else "none loaded"
-        return LlmResponse(
-            content=f"I couldn't understand that command. Available operations: {available}. "
-            "Try commands like 'start pump', 'set speed to 1200', 'get status', or 'stop pump'.",
-            finish_reason="stop",
-        )
+        # No pattern matched - provide helpful response (a fresh LlmResponse,
+        # since responses are mutable; only the text is cached)
+        return LlmResponse(content=self._tools_cache[2], finish_reason="stop")
 
     async def close(self) -> None:
         """No resources to clean up."""
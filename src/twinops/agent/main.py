@@ -1,33 +1,43 @@
 """Agent HTTP server entry point."""
 
 import asyncio
+import contextlib
+import hashlib
 import json
+import math
 import os
+import random
 import signal
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Sequence
 from contextlib import AsyncExitStack, asynccontextmanager
 from dataclasses import dataclass
 from enum import StrEnum
 from pathlib import Path
-from typing import Any, cast
+from types import FrameType, ModuleType
+from typing import Any
 
 import uvicorn
 from starlette.applications import Starlette
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from starlette.routing import Route
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from twinops.agent.capabilities import CapabilityIndex
+from twinops.agent.llm.base import LlmClient
 from twinops.agent.llm.factory import create_llm_client
-from twinops.agent.orchestrator import AgentOrchestrator
+from twinops.agent.llm.openai_compat import close_shared_clients
+from twinops.agent.orchestrator import AgentOrchestrator, ToolResult
 from twinops.agent.safety import AuditLogger, RiskLevel, SafetyKernel
-from twinops.agent.schema_gen import generate_all_tool_schemas
+from twinops.agent.schema_gen import ToolSpec, generate_all_tool_schemas
 from twinops.agent.shadow import ShadowTwinManager
 from twinops.agent.twin_client import TwinClient, TwinClientError
-from twinops.common.auth import AuthContext, AuthMiddleware
+from twinops.common.auth import AuthContext, AuthMiddleware, header_roles
 from twinops.common.errors import ErrorCode, error_response
-from twinops.common.http import RequestIdMiddleware
+from twinops.common.http import ORJSONResponse, RequestIdMiddleware, read_json
+from twinops.common.idempotency import IdempotencyStore
 from twinops.common.logging import get_logger, setup_logging
 from twinops.common.mqtt import MqttClient
 from twinops.common.ratelimit import RateLimitMiddleware
@@ -66,20 +76,145 @@ class StartupValidationError(Exception):
         super().__init__(f"Startup validation failed: {'; '.join(messages)}")
 
 
+class InFlightMiddleware:
+    """
+    ASGI middleware gating and counting HTTP requests for shutdown draining.
+
+    Wrapping the whole app means every endpoint is covered, not only the
+    handlers that remember to report themselves. Once shutdown starts, new
+    requests get a 503 before any handler code runs.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        shutdown: "GracefulShutdown",
+        exclude_paths: Iterable[str] | None = None,
+    ):
+        """
+        Initialize in-flight request tracking.
+
+        Args:
+            app: ASGI application
+            shutdown: Shutdown handler that owns the request counter
+            exclude_paths: Paths not counted (e.g., probes)
+        """
+        self.app = app
+        self._shutdown = shutdown
+        self._exclude_paths = frozenset(exclude_paths or ())
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self._exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        if self._shutdown.is_shutting_down:
+            response = error_response(
+                ErrorCode.SERVER_SHUTTING_DOWN,
+                "Server is shutting down",
+                status_code=503,
+            )
+            # Ask the client to drop its keep-alive connection
+            response.headers["Connection"] = "close"
+            await response(scope, receive, send)
+            return
+
+        shutdown = self._shutdown
+
+        async def send_wrapper(message: Message) -> None:
+            # Requests still running when shutdown starts close their
+            # connection after responding instead of idling until the timeout
+            if message["type"] == "http.response.start" and shutdown.is_shutting_down:
+                headers = [
+                    (key, value)
+                    for key, value in message.get("headers", [])
+                    if key.lower() != b"connection"
+                ]
+                headers.append((b"connection", b"close"))
+                message["headers"] = headers
+            await send(message)
+
+        shutdown.request_started()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            shutdown.request_finished()
+
+
+class DirectRouteMiddleware:
+    """
+    ASGI middleware serving one GET path straight from its endpoint.
+
+    Requests for that path skip every middleware registered before this one
+    (i.e. further in), as well as route matching.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path: str,
+        endpoint: Callable[[Request], Awaitable[Response]],
+    ):
+        """
+        Initialize the direct route.
+
+        Args:
+            app: ASGI application
+            path: Exact request path to serve
+            endpoint: Request handler for the path
+        """
+        self.app = app
+        self._path = path
+        self._endpoint = endpoint
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] == "http"
+            and scope["path"] == self._path
+            and scope["method"] in ("GET", "HEAD")
+        ):
+            response = await self._endpoint(Request(scope, receive))
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+def _load_metrics() -> ModuleType | None:
+    """
+    Import the metrics module for a server, or return None if unavailable.
+
+    Not imported at module level: prometheus_client picks up the multiprocess
+    directory set by _configure_metrics when the metrics are created.
+    """
+    try:
+        from twinops.common import metrics
+    except Exception as e:
+        # Surface the failure once at startup rather than hiding it per probe
+        logger.warning("Metrics unavailable; gauges will not be updated", error=str(e))
+        return None
+    return metrics
+
+
 class GracefulShutdown:
     """Handles graceful shutdown with request draining."""
 
-    def __init__(self, drain_timeout: float = 30.0):
+    def __init__(self, drain_timeout: float = 30.0, metrics: ModuleType | None = None):
         """
         Initialize graceful shutdown handler.
 
         Args:
             drain_timeout: Maximum time to wait for in-flight requests
+            metrics: Loaded metrics module, if available
         """
         self._drain_timeout = drain_timeout
         self._shutdown_event = asyncio.Event()
+        # Set once shutdown is triggered and no requests are in flight
+        self._drain_complete = asyncio.Event()
         self._active_requests = 0
         self._start_time: float | None = None
+        self._update_active_requests: Callable[[int], None] | None = (
+            metrics.update_active_requests if metrics else None
+        )
 
     @property
     def is_shutting_down(self) -> bool:
@@ -91,58 +226,127 @@ class GracefulShutdown:
         """Get count of active requests."""
         return self._active_requests
 
+    # Counter updates need no lock: they only run on the event loop thread.
     def request_started(self) -> None:
         """Track start of a request."""
         self._active_requests += 1
-        try:
-            from twinops.common.metrics import update_active_requests
-
-            update_active_requests(self._active_requests)
-        except Exception:
-            pass
+        self._drain_complete.clear()
+        if self._update_active_requests is not None:
+            self._update_active_requests(self._active_requests)
 
     def request_finished(self) -> None:
         """Track completion of a request."""
         self._active_requests = max(0, self._active_requests - 1)
-        try:
-            from twinops.common.metrics import update_active_requests
-
-            update_active_requests(self._active_requests)
-        except Exception:
-            pass
+        if self._active_requests == 0 and self._shutdown_event.is_set():
+            self._drain_complete.set()
+        if self._update_active_requests is not None:
+            self._update_active_requests(self._active_requests)
 
     def trigger_shutdown(self) -> None:
         """Trigger graceful shutdown."""
         logger.info("Graceful shutdown triggered")
-        self._start_time = time.time()
+        if self._start_time is None:
+            self._start_time = time.monotonic()
         self._shutdown_event.set()
+        # No request will finish to signal the drain if none are running
+        if self._active_requests == 0:
+            self._drain_complete.set()
 
     async def wait_for_drain(self) -> None:
-        """Wait for in-flight requests to complete."""
+        """Wait for in-flight requests to complete (call after trigger_shutdown)."""
         if self._start_time is None:
-            self._start_time = time.time()
-
-        while self._active_requests > 0:
-            elapsed = time.time() - self._start_time
-            if elapsed >= self._drain_timeout:
-                logger.warning(
-                    "Drain timeout reached, forcing shutdown",
-                    active_requests=self._active_requests,
-                    timeout=self._drain_timeout,
-                )
-                break
+            self._start_time = time.monotonic()
 
-            logger.info(
-                "Waiting for requests to drain",
+        if self._active_requests > 0:
+            logger.info("Waiting for requests to drain", active_requests=self._active_requests)
+
+        remaining = self._drain_timeout - (time.monotonic() - self._start_time)
+        try:
+            await asyncio.wait_for(self._drain_complete.wait(), timeout=max(0.0, remaining))
+        except TimeoutError:
+            logger.warning(
+                "Drain timeout reached, forcing shutdown",
                 active_requests=self._active_requests,
-                elapsed=round(elapsed, 1),
+                timeout=self._drain_timeout,
             )
-            await asyncio.sleep(0.5)
-
-        if self._active_requests == 0:
+        else:
             logger.info("All requests drained successfully")
 
 
+# Constant /reset payload, encoded once
+_RESET_BODY = b'{"status":"ok"}'
+# Probe and scrape paths skipped by rate limiting, metrics and drain tracking
+_PROBE_PATHS = frozenset(("/health", "/ready", "/metrics"))
+# Fixed leading part of every /health body
+_HEALTH_BODY_PREFIX = '{"status":"healthy","uptime":'
+# The OpenAPI spec only changes when settings do, i.e. across restarts
+_OPENAPI_CACHE_HEADERS = {"Cache-Control": "public, max-age=3600"}
+
+
+@dataclass(slots=True)
+class _ChatToolResult:
+    """Tool result as returned by /chat (encoded by orjson without a dict)."""
+
+    tool: str
+    success: bool
+    result: dict[str, Any] | None
+    error: str | None
+    simulated: bool
+    status: str
+
+
+@dataclass(slots=True)
+class _ExecuteToolResult:
+    """Tool result as returned by task execution."""
+
+    tool: str
+    success: bool
+    result: dict[str, Any] | None
+    error: str | None
+    job_id: str | None
+    status: str
+
+
+def _json_float(value: float) -> str:
+    """Format a float as JSON, mapping inf/nan to null as orjson does."""
+    return repr(value) if math.isfinite(value) else "null"
+
+
+def _chat_tool_results(results: Sequence[ToolResult]) -> list[_ChatToolResult]:
+    """Convert tool results into their /chat response shape."""
+    return [
+        _ChatToolResult(r.tool_name, r.success, r.result, r.error, r.simulated, r.status)
+        for r in results
+    ]
+
+
+def _execute_tool_results(results: Sequence[ToolResult]) -> list[_ExecuteToolResult]:
+    """Convert tool results into their task execution response shape."""
+    return [
+        _ExecuteToolResult(r.tool_name, r.success, r.result, r.error, r.job_id, r.status)
+        for r in results
+    ]
+
+
+def _build_capabilities(
+    operations: list[dict[str, Any]],
+) -> tuple[list[ToolSpec], CapabilityIndex]:
+    """Generate tool schemas for AAS operations and index them for retrieval."""
+    tools = generate_all_tool_schemas(operations)
+    return tools, CapabilityIndex(tools)
+
+
+async def _optional_json_object(request: Request) -> dict[str, Any]:
+    """Decode an optional JSON object body; empty or invalid bodies give {}."""
+    if not await request.body():
+        return {}
+    try:
+        body = await read_json(request)
+    except (json.JSONDecodeError, ValueError):
+        return {}
+    return body if isinstance(body, dict) else {}
+
+
 class AgentServer:
     """HTTP server wrapper for the agent."""
 
@@ -154,55 +358,69 @@ class AgentServer:
         self._mqtt_client: MqttClient | None = None
         self._shadow: ShadowTwinManager | None = None
         self._safety: SafetyKernel | None = None
-        self._shutdown = GracefulShutdown(drain_timeout=30.0)
+        self._audit: AuditLogger | None = None
+        self._metrics = _load_metrics()
+        self._shutdown = GracefulShutdown(drain_timeout=30.0, metrics=self._metrics)
         self._initialized = False
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
         self._exit_stack = AsyncExitStack()
+        # Serialized text-only /chat replies keyed by roles and message digest
+        self._chat_cache = (
+            IdempotencyStore(
+                ttl_seconds=settings.chat_cache_ttl_seconds,
+                max_entries=settings.chat_cache_size,
+            )
+            if settings.chat_cache_size > 0
+            else None
+        )
+        # Last rendered /ready body, its status code and the values behind it
+        self._ready_cache: tuple[tuple[Any, ...], bytes, int] | None = None
+        # The spec only depends on settings: encode it once, up front
+        self._openapi_body: bytes = bytes(ORJSONResponse(self._openapi_spec()).body)
+        openapi_etag = f'"{hashlib.blake2b(self._openapi_body, digest_size=8).hexdigest()}"'
+        self._openapi_headers = {**_OPENAPI_CACHE_HEADERS, "ETag": openapi_etag}
 
     async def _validate_dependencies(self) -> list[DependencyCheck]:
         """
         Validate all dependencies are available before full startup.
 
+        Independent probes run concurrently, so a validation round takes as
+        long as the slowest probe rather than the sum of all of them.
+
         Returns:
             List of dependency check results
         """
-        checks: list[DependencyCheck] = []
         if not self._twin_client:
             raise RuntimeError("Twin client not initialized")
 
-        # Check AAS Repository
-        try:
-            aas_list = await self._twin_client.get_all_aas()
-            checks.append(
-                DependencyCheck(
-                    name="aas_repository",
-                    status=DependencyStatus.OK,
-                    message=f"Connected, {len(aas_list)} AAS available",
-                    details={"aas_count": len(aas_list)},
-                )
-            )
+        probes: tuple[tuple[str, Callable[[], Awaitable[list[DependencyCheck]]]], ...] = (
+            ("aas_repository", self._check_aas_repository),
+        )
+        results = await asyncio.gather(*(probe() for _, probe in probes), return_exceptions=True)
 
-            # Check if configured AAS exists
-            if self._settings.startup_validate_aas:
-                aas_ids = [aas.get("id", "") for aas in aas_list]
-                if self._settings.aas_id in aas_ids:
-                    checks.append(
-                        DependencyCheck(
-                            name="configured_aas",
-                            status=DependencyStatus.OK,
-                            message=f"AAS '{self._settings.aas_id}' found",
-                        )
-                    )
-                else:
-                    checks.append(
-                        DependencyCheck(
-                            name="configured_aas",
-                            status=DependencyStatus.NOT_FOUND,
-                            message=f"AAS '{self._settings.aas_id}' not found in repository",
-                            details={"available_aas": aas_ids[:10]},  # Limit for logging
-                        )
+        checks: list[DependencyCheck] = []
+        for (name, _), result in zip(probes, results, strict=True):
+            if isinstance(result, Exception):
+                checks.append(
+                    DependencyCheck(
+                        name=name,
+                        status=DependencyStatus.ERROR,
+                        message=f"Unexpected error: {result}",
                     )
+                )
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                checks.extend(result)
+        return checks
 
+    async def _check_aas_repository(self) -> list[DependencyCheck]:
+        """Check the AAS repository and, if enabled, that the configured AAS exists."""
+        if not self._twin_client:
+            raise RuntimeError("Twin client not initialized")
+        checks: list[DependencyCheck] = []
+        try:
+            aas_list = await self._twin_client.get_all_aas()
         except TwinClientError as e:
             checks.append(
                 DependencyCheck(
@@ -212,15 +430,37 @@ class AgentServer:
                     details={"url": self._settings.twin_base_url},
                 )
             )
-        except Exception as e:
-            checks.append(
-                DependencyCheck(
-                    name="aas_repository",
-                    status=DependencyStatus.ERROR,
-                    message=f"Unexpected error: {e}",
-                )
+            return checks
+
+        checks.append(
+            DependencyCheck(
+                name="aas_repository",
+                status=DependencyStatus.OK,
+                message=f"Connected, {len(aas_list)} AAS available",
+                details={"aas_count": len(aas_list)},
             )
+        )
 
+        # Check if configured AAS exists
+        if self._settings.startup_validate_aas:
+            aas_ids = [aas.get("id", "") for aas in aas_list]
+            if self._settings.aas_id in aas_ids:
+                checks.append(
+                    DependencyCheck(
+                        name="configured_aas",
+                        status=DependencyStatus.OK,
+                        message=f"AAS '{self._settings.aas_id}' found",
+                    )
+                )
+            else:
+                checks.append(
+                    DependencyCheck(
+                        name="configured_aas",
+                        status=DependencyStatus.NOT_FOUND,
+                        message=f"AAS '{self._settings.aas_id}' not found in repository",
+                        details={"available_aas": aas_ids[:10]},  # Limit for logging
+                    )
+                )
         return checks
 
     async def _wait_for_dependencies(self) -> None:
@@ -230,10 +470,11 @@ class AgentServer:
         Raises:
             StartupValidationError: If dependencies don't become available within timeout
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         last_checks: list[DependencyCheck] = []
+        delay = self._settings.startup_retry_interval
 
-        while time.time() - start_time < self._settings.startup_timeout:
+        while time.monotonic() - start_time < self._settings.startup_timeout:
             last_checks = await self._validate_dependencies()
 
             # Check if all critical dependencies are OK
@@ -255,22 +496,37 @@ class AgentServer:
                     )
                 return
 
+            # Exponential backoff with jitter, so agents restarting together don't
+            # probe a recovering repository in lockstep
+            sleep_for = min(delay, self._settings.startup_retry_max_interval)
+            jitter = sleep_for * self._settings.startup_retry_jitter
+            if jitter:
+                sleep_for = max(0.0, sleep_for + random.uniform(-jitter, jitter))
+            delay *= 2
+
             # Log retry
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             remaining = self._settings.startup_timeout - elapsed
             logger.warning(
                 "Dependencies not ready, retrying...",
                 failed_checks=[c.name for c in critical_failed],
                 elapsed=round(elapsed, 1),
                 remaining=round(remaining, 1),
-                retry_interval=self._settings.startup_retry_interval,
+                retry_interval=round(sleep_for, 1),
             )
 
-            await asyncio.sleep(self._settings.startup_retry_interval)
+            await asyncio.sleep(min(sleep_for, max(0.0, remaining)))
 
         # Timeout reached
         raise StartupValidationError(last_checks)
 
+    async def _create_llm_client(self) -> LlmClient:
+        """Create the LLM client off the event loop and optionally warm it up."""
+        llm = await asyncio.to_thread(create_llm_client, self._settings)
+        if self._settings.llm_warm_up:
+            await llm.warm_up()
+        return llm
+
     async def startup(self) -> None:
         """Initialize all components with dependency validation."""
         logger.info(
@@ -280,62 +536,92 @@ class AgentServer:
             mqtt_host=self._settings.mqtt_broker_host,
         )
 
-        # Create twin client first (needed for validation)
-        self._twin_client = TwinClient(self._settings)
-        await self._twin_client.__aenter__()
-
-        # Validate dependencies before proceeding
-        try:
-            await self._wait_for_dependencies()
-        except StartupValidationError as e:
-            logger.error(
-                "Startup validation failed",
-                failed_checks=[
-                    {"name": c.name, "status": c.status.value, "message": c.message}
-                    for c in e.checks
-                    if c.status != DependencyStatus.OK
-                ],
-            )
-            # Clean up twin client
-            await self._twin_client.__aexit__(None, None, None)
-            raise
-
-        # Create MQTT client
-        self._mqtt_client = MqttClient(
-            host=self._settings.mqtt_broker_host,
-            port=self._settings.mqtt_broker_port,
-            client_id=self._settings.mqtt_client_id,
-            username=self._settings.mqtt_username,
-            password=self._settings.mqtt_password,
-            tls=self._settings.mqtt_tls_enabled,
-            tls_ca_cert=self._settings.mqtt_tls_ca_cert,
-            tls_client_cert=self._settings.mqtt_tls_client_cert,
-            tls_client_key=self._settings.mqtt_tls_client_key,
+        # The LLM client (SDK import, HTTP client setup, connection warm-up) and the
+        # audit log (scanned for its last hash) don't depend on the twin or MQTT:
+        # build them while the dependency chain below runs
+        llm_task = asyncio.ensure_future(self._create_llm_client())
+        side_tasks = asyncio.gather(
+            llm_task,
+            asyncio.to_thread(AuditLogger, self._settings.audit_log_path),
         )
+        try:
+            # Create twin client first (needed for validation)
+            self._twin_client = TwinClient(self._settings)
+            await self._twin_client.__aenter__()
 
-        # Create shadow twin with separate repo IDs for AAS and Submodel repositories
-        self._shadow = ShadowTwinManager(
-            twin_client=self._twin_client,
-            mqtt_client=self._mqtt_client,
-            aas_id=self._settings.aas_id,
-            aas_repo_id=self._settings.effective_aas_repo_id,
-            settings=self._settings,
-            submodel_repo_id=self._settings.effective_submodel_repo_id,
-        )
+            # Validate dependencies before proceeding
+            try:
+                await self._wait_for_dependencies()
+            except StartupValidationError as e:
+                logger.error(
+                    "Startup validation failed",
+                    failed_checks=[
+                        {"name": c.name, "status": c.status.value, "message": c.message}
+                        for c in e.checks
+                        if c.status != DependencyStatus.OK
+                    ],
+                )
+                # The outer handler closes the twin client
+                raise
+
+            # Create MQTT client
+            self._mqtt_client = MqttClient(
+                host=self._settings.mqtt_broker_host,
+                port=self._settings.mqtt_broker_port,
+                client_id=self._settings.mqtt_client_id,
+                username=self._settings.mqtt_username,
+                password=self._settings.mqtt_password,
+                tls=self._settings.mqtt_tls_enabled,
+                tls_ca_cert=self._settings.mqtt_tls_ca_cert,
+                tls_client_cert=self._settings.mqtt_tls_client_cert,
+                tls_client_key=self._settings.mqtt_tls_client_key,
+            )
 
-        # Initialize shadow (connects MQTT and keeps connection open)
-        await self._exit_stack.enter_async_context(self._mqtt_client.connect())
-        await self._shadow.initialize()
+            # Create shadow twin with separate repo IDs for AAS and Submodel repositories
+            self._shadow = ShadowTwinManager(
+                twin_client=self._twin_client,
+                mqtt_client=self._mqtt_client,
+                aas_id=self._settings.aas_id,
+                aas_repo_id=self._settings.effective_aas_repo_id,
+                settings=self._settings,
+                submodel_repo_id=self._settings.effective_submodel_repo_id,
+            )
 
-        # Load operations and build capability index
-        operations = await self._shadow.get_operations()
-        tools = generate_all_tool_schemas(operations)
-        capabilities = CapabilityIndex(tools)
+            # Initialize shadow (connects MQTT and keeps connection open)
+            await self._exit_stack.enter_async_context(self._mqtt_client.connect())
+            await self._shadow.initialize()
+
+            # Load operations and build capability index. Schema generation and the
+            # index fit are CPU-bound: run them in a worker thread so the LLM
+            # warm-up still in flight on the event loop keeps making progress
+            operations = await self._shadow.get_operations()
+            tools, capabilities = await asyncio.to_thread(_build_capabilities, operations)
+
+            logger.info("Loaded tools from AAS", count=len(tools))
+
+            llm, audit = await side_tasks
+        except BaseException:
+            side_tasks.cancel()
+            with contextlib.suppress(BaseException):
+                await side_tasks
+            # Lifespan never calls shutdown() for a failed startup: release the MQTT
+            # connection held by the exit stack, the twin client session and an LLM
+            # client that was already built (the audit logger holds no resources
+            # until its writer starts)
+            await self._exit_stack.aclose()
+            if self._twin_client:
+                await self._twin_client.__aexit__(None, None, None)
+            if llm_task.done() and not llm_task.cancelled() and llm_task.exception() is None:
+                with contextlib.suppress(Exception):
+                    await llm_task.result().close()
+            await close_shared_clients()
+            raise
 
-        logger.info("Loaded tools from AAS", count=len(tools))
+        if self._settings.audit_background_writes:
+            audit.start_writer()
+        self._audit = audit
 
         # Create safety kernel
-        audit = AuditLogger(self._settings.audit_log_path)
         self._safety = SafetyKernel(
             shadow=self._shadow,
             twin_client=self._twin_client,
@@ -348,9 +634,6 @@ class AgentServer:
             default_risk_level=RiskLevel(self._settings.default_risk_level),
         )
 
-        # Create LLM client
-        llm = create_llm_client(self._settings)
-
         # Create orchestrator
         if not self._shadow or not self._twin_client or not self._safety:
             raise RuntimeError("Agent dependencies not initialized")
@@ -383,36 +666,35 @@ class AgentServer:
         if self._twin_client:
             await self._twin_client.__aexit__(None, None, None)
 
+        await close_shared_clients()
+
+        if self._audit:
+            await self._audit.aclose()
+
         logger.info("Agent server shutdown complete")
 
-    def _get_roles(self, request: Request) -> tuple[str, ...]:
-        auth = cast(AuthContext | None, getattr(request.state, "auth", None))
-        if auth and auth.roles:
-            return auth.roles
-        roles_header = request.headers.get("X-Roles", "")
-        roles = tuple(r.strip() for r in roles_header.split(",") if r.strip())
-        return roles or self._settings.default_roles
-
-    def _get_subject(self, request: Request, fallback: str) -> str:
-        auth = cast(AuthContext | None, getattr(request.state, "auth", None))
-        if auth and auth.subject:
-            return auth.subject
-        return fallback
-
-    def _auth_method(self, request: Request) -> str:
-        auth = cast(AuthContext | None, getattr(request.state, "auth", None))
-        return auth.method if auth else "header"
-
-    async def handle_chat(self, request: Request) -> JSONResponse:
-        """Handle chat endpoint."""
-        # Reject requests during shutdown
-        if self._shutdown.is_shutting_down:
-            return error_response(
-                ErrorCode.SERVER_SHUTTING_DOWN,
-                "Server is shutting down",
-                status_code=503,
-            )
+    @staticmethod
+    def _auth_context(request: Request) -> AuthContext:
+        # AuthMiddleware sets this on every request, exempt paths included
+        auth: AuthContext = request.state.auth
+        return auth
 
+    def _get_roles(self, request: Request, auth: AuthContext | None = None) -> tuple[str, ...]:
+        # Handlers that already looked up the auth context pass it in
+        if auth is None:
+            auth = self._auth_context(request)
+        return auth.roles or header_roles(request) or self._settings.default_roles
+
+    @staticmethod
+    def _get_subject(auth: AuthContext, fallback: str) -> str:
+        return auth.subject or fallback
+
+    @staticmethod
+    def _auth_method(auth: AuthContext) -> str:
+        return auth.method
+
+    async def handle_chat(self, request: Request) -> Response:
+        """Handle chat endpoint."""
         if not self._orchestrator:
             return error_response(
                 ErrorCode.SERVER_NOT_READY,
@@ -420,125 +702,152 @@ class AgentServer:
                 status_code=503,
             )
 
-        self._shutdown.request_started()
         try:
-            try:
-                body = await request.json()
-            except json.JSONDecodeError:
-                return error_response(
-                    ErrorCode.INVALID_JSON,
-                    "Invalid JSON",
-                    status_code=400,
-                )
+            body = await read_json(request)
+        except json.JSONDecodeError:
+            return error_response(
+                ErrorCode.INVALID_JSON,
+                "Invalid JSON",
+                status_code=400,
+            )
 
-            message = body.get("message", "")
-            if not message:
-                return error_response(
-                    ErrorCode.MISSING_FIELD,
-                    "Missing 'message' field",
-                    status_code=400,
-                    details={"field": "message"},
-                )
+        # Validate shape and type in one step: non-object bodies and
+        # non-string messages are rejected like a missing field
+        message = body.get("message") if isinstance(body, dict) else None
+        if not isinstance(message, str) or not message:
+            return error_response(
+                ErrorCode.MISSING_FIELD,
+                "Missing 'message' field",
+                status_code=400,
+                details={"field": "message"},
+            )
 
-            roles = self._get_roles(request)
+        roles = self._get_roles(request)
 
-            # Process message
-            response = await self._orchestrator.process_message(message, roles)
+        cache_key = None
+        if self._chat_cache is not None:
+            digest = hashlib.blake2b(message.encode("utf-8"), digest_size=16).hexdigest()
+            cache_key = f"{','.join(roles)}|{digest}"
+            cached = self._chat_cache.get(cache_key)
+            if cached is not None:
+                return Response(cached, media_type="application/json")
 
-            return JSONResponse(
-                {
-                    "reply": response.reply,
-                    "tool_results": [
-                        {
-                            "tool": r.tool_name,
-                            "success": r.success,
-                            "result": r.result,
-                            "error": r.error,
-                            "simulated": r.simulated,
-                            "status": r.status,
-                        }
-                        for r in response.tool_results
-                    ],
-                    "pending_approval": response.pending_approval,
-                    "task_id": response.task_id,
-                }
-            )
-        finally:
-            self._shutdown.request_finished()
+        # Process message
+        response = await self._orchestrator.process_message(message, roles)
+
+        result = ORJSONResponse(
+            {
+                "reply": response.reply,
+                "tool_results": _chat_tool_results(response.tool_results),
+                "pending_approval": response.pending_approval,
+                "task_id": response.task_id,
+            }
+        )
+        # Only replies without tool calls or errors are replayed
+        if cache_key is not None and self._chat_cache is not None and response.cacheable:
+            self._chat_cache.set(cache_key, bytes(result.body))
+        return result
 
-    async def handle_health(self, _request: Request) -> JSONResponse:
+    async def handle_health(self, _request: Request) -> Response:
         """
         Liveness probe endpoint.
 
         Returns healthy if the process is running.
         Used by Kubernetes liveness probes.
         """
-        response_data = {
-            "status": "healthy",
-            "uptime": round(time.time() - self._start_time, 1),
-            "shutting_down": self._shutdown.is_shutting_down,
-        }
+        uptime = round(time.monotonic() - self._start_time, 1)
+        # Splice the few dynamic values into a fixed body instead of encoding
+        # a dict: uptime changes every probe, so the body is never reused
+        body = _HEALTH_BODY_PREFIX + (
+            f"{uptime!r},\"shutting_down\":"
+            f"{'true' if self._shutdown.is_shutting_down else 'false'}"
+        )
 
         # Include shadow twin freshness if initialized
-        if self._shadow and self._shadow.is_initialized:
-            response_data["shadow_freshness_seconds"] = round(self._shadow.freshness_seconds, 1)
-            response_data["shadow_event_count"] = self._shadow.event_count
+        shadow = self._shadow
+        if shadow and shadow.is_initialized:
+            body += (
+                f',"shadow_freshness_seconds":{_json_float(round(shadow.freshness_seconds, 1))}'
+                f',"shadow_event_count":{shadow.event_count}'
+            )
 
-        return JSONResponse(response_data)
+        return Response((body + "}").encode(), media_type="application/json")
 
-    async def handle_ready(self, _request: Request) -> JSONResponse:
+    async def handle_ready(self, _request: Request) -> Response:
         """
         Readiness probe endpoint.
 
         Checks if all dependencies are ready to serve traffic.
         Used by Kubernetes readiness probes.
         """
+        mqtt_connected = self._mqtt_client.is_connected if self._mqtt_client else False
+        circuit = self._twin_client.circuit_breaker.state.value if self._twin_client else "unknown"
+        shutting_down = self._shutdown.is_shutting_down
+        active_requests = self._shutdown.active_requests
+        shadow = self._shadow
+        # Failed background audit writes, or a dead writer thread, leave gaps
+        # in the tamper-evident log
+        audit_ok = self._audit is None or self._audit.is_healthy
+
+        metrics = self._metrics
+        if metrics is not None and shadow and shadow.is_initialized:
+            try:
+                metrics.update_shadow_freshness(shadow.freshness_seconds)
+            except Exception:
+                pass
+
+        # Steady-state probes see the same values and reuse the last body
+        key = (
+            self._initialized,
+            self._orchestrator is not None,
+            mqtt_connected,
+            shadow is not None,
+            circuit,
+            audit_ok,
+            shutting_down,
+            active_requests,
+        )
+        cached = self._ready_cache
+        if cached is not None and cached[0] == key:
+            return Response(cached[1], status_code=cached[2], media_type="application/json")
+
         checks = {
             "initialized": self._initialized,
             "orchestrator": self._orchestrator is not None,
-            "mqtt_connected": (self._mqtt_client.is_connected if self._mqtt_client else False),
-            "shadow_initialized": self._shadow is not None,
-            "twin_client_circuit": (
-                self._twin_client.circuit_breaker.state.value if self._twin_client else "unknown"
-            ),
+            "mqtt_connected": mqtt_connected,
+            "shadow_initialized": shadow is not None,
+            "twin_client_circuit": circuit,
+            "audit_log": audit_ok,
         }
 
-        # Ready if initialized and not shutting down
-        all_ready = (
-            self._initialized
-            and not self._shutdown.is_shutting_down
-            and checks.get("mqtt_connected", False)
-        )
+        # Ready if initialized, not shutting down and the audit log is intact
+        all_ready = self._initialized and not shutting_down and mqtt_connected and audit_ok
 
-        try:
-            from twinops.common.metrics import (
-                update_circuit_breaker_state,
-                update_mqtt_status,
-                update_shadow_freshness,
-            )
-
-            update_mqtt_status(bool(checks.get("mqtt_connected", False)))
-            if self._shadow and self._shadow.is_initialized:
-                update_shadow_freshness(self._shadow.freshness_seconds)
-            if self._twin_client:
-                update_circuit_breaker_state(self._twin_client.circuit_breaker.state.value)
-        except Exception:
-            pass
+        # Gauges only need pushing when the values behind them change
+        if metrics is not None:
+            try:
+                metrics.update_mqtt_status(bool(mqtt_connected))
+                if self._twin_client:
+                    metrics.update_circuit_breaker_state(circuit)
+            except Exception:
+                pass
 
-        return JSONResponse(
+        response = ORJSONResponse(
             {
                 "status": "ready" if all_ready else "not_ready",
                 "checks": checks,
-                "active_requests": self._shutdown.active_requests,
+                "active_requests": active_requests,
             },
             status_code=200 if all_ready else 503,
         )
+        self._ready_cache = (key, bytes(response.body), response.status_code)
+        return response
 
-    async def handle_reset(self, _request: Request) -> JSONResponse:
+    async def handle_reset(self, _request: Request) -> Response:
         """Reset conversation history."""
         if self._orchestrator:
             self._orchestrator.reset_conversation()
-        return JSONResponse({"status": "ok"})
+        return Response(_RESET_BODY, media_type="application/json")
 
     async def handle_list_tasks(self, _request: Request) -> JSONResponse:
         """
@@ -555,7 +864,7 @@ class AgentServer:
 
         try:
             tasks = await self._safety.get_pending_tasks()
-            return JSONResponse(
+            return ORJSONResponse(
                 {
                     "tasks": tasks,
                     "count": len(tasks),
@@ -591,16 +900,14 @@ class AgentServer:
                 details={"field": "task_id"},
             )
 
+        auth = self._auth_context(request)
         approver = "unknown"
-        if self._auth_method(request) != "mtls":
-            try:
-                body = await request.json()
-                approver = body.get("approver", approver)
-            except (json.JSONDecodeError, ValueError):
-                pass
+        if self._auth_method(auth) != "mtls":
+            body = await _optional_json_object(request)
+            approver = body.get("approver", approver)
             approver = request.headers.get("X-Approver", approver)
-        approver = self._get_subject(request, approver)
-        roles = self._get_roles(request)
+        approver = self._get_subject(auth, approver)
+        roles = self._get_roles(request, auth)
 
         try:
             if not await self._safety.is_approval_authorized(roles):
@@ -612,7 +919,7 @@ class AgentServer:
                 )
             success = await self._safety.approve_task(task_id, approver, roles)
             if success:
-                return JSONResponse(
+                return ORJSONResponse(
                     {
                         "status": "approved",
                         "task_id": task_id,
@@ -656,18 +963,16 @@ class AgentServer:
                 details={"field": "task_id"},
             )
 
+        auth = self._auth_context(request)
         rejector = "unknown"
         reason = ""
-        if self._auth_method(request) != "mtls":
-            try:
-                body = await request.json()
-                rejector = body.get("rejector", rejector)
-                reason = body.get("reason", reason)
-            except (json.JSONDecodeError, ValueError):
-                pass
+        if self._auth_method(auth) != "mtls":
+            body = await _optional_json_object(request)
+            rejector = body.get("rejector", rejector)
+            reason = body.get("reason", reason)
             rejector = request.headers.get("X-Rejector", rejector)
-        rejector = self._get_subject(request, rejector)
-        roles = self._get_roles(request)
+        rejector = self._get_subject(auth, rejector)
+        roles = self._get_roles(request, auth)
 
         try:
             if not await self._safety.is_approval_authorized(roles):
@@ -679,7 +984,7 @@ class AgentServer:
                 )
             success = await self._safety.reject_task(task_id, rejector, reason, roles)
             if success:
-                return JSONResponse(
+                return ORJSONResponse(
                     {
                         "status": "rejected",
                         "task_id": task_id,
@@ -727,7 +1032,7 @@ class AgentServer:
         try:
             task = await self._safety.get_task(task_id)
             if task:
-                return JSONResponse({"task": task})
+                return ORJSONResponse({"task": task})
             else:
                 return error_response(
                     ErrorCode.NOT_FOUND,
@@ -767,24 +1072,13 @@ class AgentServer:
 
         roles = self._get_roles(request)
 
-        self._shutdown.request_started()
         try:
             response = await self._orchestrator.execute_approved_task(task_id, roles)
 
-            return JSONResponse(
+            return ORJSONResponse(
                 {
                     "reply": response.reply,
-                    "tool_results": [
-                        {
-                            "tool": r.tool_name,
-                            "success": r.success,
-                            "result": r.result,
-                            "error": r.error,
-                            "job_id": r.job_id,
-                            "status": r.status,
-                        }
-                        for r in response.tool_results
-                    ],
+                    "tool_results": _execute_tool_results(response.tool_results),
                 }
             )
         except Exception as e:
@@ -794,16 +1088,32 @@ class AgentServer:
                 "Failed to execute task",
                 status_code=500,
             )
-        finally:
-            self._shutdown.request_finished()
 
-    async def handle_openapi(self, _request: Request) -> JSONResponse:
+    async def handle_openapi(self, request: Request) -> Response:
         """
         OpenAPI specification endpoint.
 
-        Returns the OpenAPI 3.1 specification for this API.
+        Returns the OpenAPI 3.1 specification for this API. The spec only
+        depends on settings, so it is encoded when the server is built, and
+        clients and proxies may cache it. Clients revalidating with a
+        matching If-None-Match get an empty 304.
         """
-        openapi_spec = {
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            etag = self._openapi_headers["ETag"]
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            if etag in tags or "*" in tags:
+                return Response(status_code=304, headers=self._openapi_headers)
+
+        return Response(
+            self._openapi_body,
+            media_type="application/json",
+            headers=self._openapi_headers,
+        )
+
+    def _openapi_spec(self) -> dict[str, Any]:
+        """Build the OpenAPI 3.1 specification for this API."""
+        openapi_spec: dict[str, Any] = {
             "openapi": "3.1.0",
             "info": {
                 "title": "TwinOps Agent API",
@@ -1547,54 +1857,78 @@ class AgentServer:
         }
         if self._settings.auth_mode == "mtls":
             openapi_spec["security"] = [{"mutualTLS": []}]
-        return JSONResponse(openapi_spec)
+        return openapi_spec
 
 
-def create_app(settings: Settings | None = None) -> Starlette:
-    """Create the Starlette application."""
-    settings = settings or get_settings()
-    _configure_metrics(settings)
-    from twinops.common.metrics import MetricsMiddleware, metrics_endpoint
-
-    server = AgentServer(settings)
+@asynccontextmanager
+async def _lifespan(app: Starlette) -> AsyncIterator[None]:
+    """Start and stop the AgentServer stored on ``app.state.server``."""
+    server: AgentServer = app.state.server
 
-    @asynccontextmanager
-    async def lifespan(_app: Starlette) -> AsyncIterator[None]:
-        # Setup signal handlers for graceful shutdown
-        loop = asyncio.get_running_loop()
+    # Chain onto the handlers uvicorn installed instead of replacing them, so
+    # a signal both starts the drain here and lets uvicorn begin its exit
+    loop = asyncio.get_running_loop()
+    previous: dict[int, Any] = {}
 
-        def handle_signal() -> None:
-            logger.info("Received shutdown signal")
-            server._shutdown.trigger_shutdown()
+    def handle_signal(signum: int, frame: FrameType | None) -> None:
+        loop.call_soon_threadsafe(server._shutdown.trigger_shutdown)
+        handler = previous.get(signum)
+        if callable(handler):
+            handler(signum, frame)
 
+    try:
         for sig in (signal.SIGTERM, signal.SIGINT):
-            loop.add_signal_handler(sig, handle_signal)
+            previous[sig] = signal.signal(sig, handle_signal)
 
         await server.startup()
-        yield
-        await server.shutdown()
+        try:
+            yield
+        finally:
+            await server.shutdown()
+    finally:
+        # Also on failed startup, so uvicorn's own handlers are back in place
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+
 
+def create_app(settings: Settings | None = None) -> Starlette:
+    """
+    Create the Starlette application.
+
+    The AgentServer lives on ``app.state.server`` and the lifespan is a
+    module-level function, so worker processes can build the app through
+    the ``twinops.agent.main:create_app`` factory import string.
+    """
+    settings = settings or get_settings()
+    _configure_metrics(settings)
+    from twinops.common.metrics import MetricsMiddleware, metrics_endpoint
+
+    server = AgentServer(settings)
+
+    # Starlette matches routes in order: chat traffic and the probe and
+    # scrape endpoints hit most often, so they are checked first
     routes = [
         Route("/chat", server.handle_chat, methods=["POST"]),
         Route("/health", server.handle_health, methods=["GET"]),
         Route("/ready", server.handle_ready, methods=["GET"]),
-        Route("/reset", server.handle_reset, methods=["POST"]),
+        Route("/metrics", metrics_endpoint, methods=["GET"]),
         Route("/tasks", server.handle_list_tasks, methods=["GET"]),
         Route("/tasks/{task_id}", server.handle_get_task, methods=["GET"]),
         Route("/tasks/{task_id}/approve", server.handle_approve_task, methods=["POST"]),
         Route("/tasks/{task_id}/reject", server.handle_reject_task, methods=["POST"]),
         Route("/tasks/{task_id}/execute", server.handle_execute_task, methods=["POST"]),
-        Route("/metrics", metrics_endpoint, methods=["GET"]),
+        Route("/reset", server.handle_reset, methods=["POST"]),
         Route("/openapi.json", server.handle_openapi, methods=["GET"]),
     ]
 
-    app = Starlette(routes=routes, lifespan=lifespan)
+    app = Starlette(routes=routes, lifespan=_lifespan)
+    app.state.server = server
 
     # Add rate limiting middleware
     app.add_middleware(
         RateLimitMiddleware,
         requests_per_minute=settings.rate_limit_rpm,
-        exclude_paths=["/health", "/ready", "/metrics"],
+        exclude_paths=_PROBE_PATHS,
     )
 
     app.add_middleware(RequestIdMiddleware)
@@ -1605,27 +1939,56 @@ def create_app(settings: Settings | None = None) -> Starlette:
 
     app.add_middleware(
         MetricsMiddleware,
-        exclude_paths=["/health", "/ready", "/metrics"],
+        exclude_paths=_PROBE_PATHS,
+    )
+
+    # Scrapes that need no authentication skip auth, request IDs, rate
+    # limiting and request metrics entirely
+    if settings.auth_mode == "none" or "/metrics" in settings.auth_exempt_paths:
+        app.add_middleware(DirectRouteMiddleware, path="/metrics", endpoint=metrics_endpoint)
+
+    # Compression applies to every response on the way out
+    if settings.agent_gzip_min_size > 0:
+        app.add_middleware(
+            GZipMiddleware,
+            minimum_size=settings.agent_gzip_min_size,
+            compresslevel=5,
+        )
+
+    # Outermost, so drain accounting covers the full middleware stack
+    app.add_middleware(
+        InFlightMiddleware,
+        shutdown=server._shutdown,
+        exclude_paths=_PROBE_PATHS,
     )
 
     return app
 
 
+def _worker_count(settings: Settings) -> int:
+    """Resolve the configured worker count (0 means one per CPU)."""
+    if settings.agent_workers > 0:
+        return settings.agent_workers
+    return os.cpu_count() or 1
+
+
 def _configure_metrics(settings: Settings) -> None:
-    if settings.agent_workers <= 1:
+    if _worker_count(settings) <= 1:
         return
     if settings.metrics_multiprocess_dir:
         os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", settings.metrics_multiprocess_dir)
 
 
 def _prepare_multiprocess_dir(settings: Settings) -> None:
-    if settings.agent_workers <= 1 or not settings.metrics_multiprocess_dir:
+    if _worker_count(settings) <= 1 or not settings.metrics_multiprocess_dir:
         return
     metrics_dir = Path(settings.metrics_multiprocess_dir)
     metrics_dir.mkdir(parents=True, exist_ok=True)
-    for entry in metrics_dir.iterdir():
-        if entry.is_file():
-            entry.unlink()
+    # scandir reports file types from the directory listing, without a stat per entry
+    with os.scandir(metrics_dir) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                os.unlink(entry.path)
 
 
 def main() -> None:
@@ -1638,7 +2001,7 @@ def main() -> None:
             otlp_endpoint=settings.tracing_otlp_endpoint,
             enable_console=settings.tracing_console,
         )
-    workers = max(1, settings.agent_workers)
+    workers = _worker_count(settings)
 
     if workers > 1 and not settings.metrics_multiprocess_dir:
         logger.warning(
@@ -1654,6 +2017,8 @@ def main() -> None:
             host=settings.agent_host,
             port=settings.agent_port,
             log_level="info",
+            loop=settings.agent_loop,
+            http=settings.agent_http,
             factory=True,
             workers=workers,
         )
@@ -1664,6 +2029,8 @@ def main() -> None:
             host=settings.agent_host,
             port=settings.agent_port,
             log_level="info",
+            loop=settings.agent_loop,
+            http=settings.agent_http,
         )
 
 
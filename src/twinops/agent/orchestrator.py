@@ -7,7 +7,7 @@ import random
 import time
 import uuid
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import Any, cast
 
 from twinops.agent.capabilities import CapabilityIndex
@@ -27,7 +27,7 @@ from twinops.common.tracing import span
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Result of a tool execution."""
 
@@ -41,7 +41,7 @@ class ToolResult:
     action_id: str | None = None  # Idempotency key for duplicate detection
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentResponse:
     """Complete response from agent."""
 
@@ -49,6 +49,7 @@ class AgentResponse:
     tool_results: list[ToolResult] = field(default_factory=list)
     pending_approval: bool = False
     task_id: str | None = None
+    cacheable: bool = False  # Safe to replay for an identical request (no actions, no errors)
 
 
 class AgentOrchestrator:
@@ -185,7 +186,7 @@ Be concise and focus on the task at hand."""
 
         # Handle text-only response
         if not response.tool_calls:
-            return AgentResponse(reply=response.content)
+            return AgentResponse(reply=response.content, cacheable=True)
 
         # Execute tool calls
         tool_results: list[ToolResult] = []
@@ -321,7 +322,7 @@ Be concise and focus on the task at hand."""
                 error=str(e),
                 action_id=action_id,
             )
-            self._idempotency.set(idempotency_key, result_obj.__dict__)
+            self._idempotency.set(idempotency_key, asdict(result_obj))
             return result_obj
 
         simulated = bool(params.get("simulate", False))
@@ -350,7 +351,7 @@ Be concise and focus on the task at hand."""
                 simulated=simulated,
                 action_id=action_id,
             )
-            self._idempotency.set(idempotency_key, result_obj.__dict__)
+            self._idempotency.set(idempotency_key, asdict(result_obj))
             return result_obj
 
         # For simulation, indicate it was simulation-only
@@ -364,7 +365,7 @@ Be concise and focus on the task at hand."""
                 status="simulated_only",
                 action_id=action_id,
             )
-            self._idempotency.set(idempotency_key, result_obj.__dict__)
+            self._idempotency.set(idempotency_key, asdict(result_obj))
             return result_obj
 
         # Check for async job
@@ -388,7 +389,7 @@ Be concise and focus on the task at hand."""
                 job_id=job_id,
                 action_id=action_id,
             )
-            self._idempotency.set(idempotency_key, result_obj.__dict__)
+            self._idempotency.set(idempotency_key, asdict(result_obj))
             return result_obj
 
         record_outcome("success", tool.risk_level)
@@ -398,7 +399,7 @@ Be concise and focus on the task at hand."""
             result=result,
             action_id=action_id,
         )
-        self._idempotency.set(idempotency_key, result_obj.__dict__)
+        self._idempotency.set(idempotency_key, asdict(result_obj))
         return result_obj
 
     def _build_idempotency_key(self, tool_name: str, params: dict[str, Any]) -> str:
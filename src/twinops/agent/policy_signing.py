@@ -1,7 +1,10 @@
 """CovenantTwin - Cryptographically signed policy verification."""
 
 import base64
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from cryptography.exceptions import InvalidSignature
@@ -10,8 +13,19 @@ from cryptography.hazmat.primitives.asymmetric import ed25519
 
 from twinops.common.logging import get_logger
 
+nacl_signing: Any | None
+NaclBadSignatureError: Any
+try:
+    from nacl import signing as nacl_signing
+    from nacl.exceptions import BadSignatureError as NaclBadSignatureError
+except ImportError:  # pragma: no cover - libsodium backend is optional
+    nacl_signing = None
+    NaclBadSignatureError = None
+
 logger = get_logger(__name__)
 
+ED25519_SIGNATURE_BYTES = 64
+
 
 class PolicyVerificationError(Exception):
     """Error verifying policy signature."""
@@ -29,8 +43,59 @@ class SignedPolicy:
     is_verified: bool = False
 
 
+@lru_cache(maxsize=32)
+def _load_public_key(public_key_pem: str) -> ed25519.Ed25519PublicKey:
+    """Parse and cache an Ed25519 public key from PEM."""
+    pub_key = serialization.load_pem_public_key(public_key_pem.encode("utf-8"))
+    if not isinstance(pub_key, ed25519.Ed25519PublicKey):
+        raise PolicyVerificationError("Key is not Ed25519")
+    return pub_key
+
+
+@lru_cache(maxsize=32)
+def _load_private_key(private_key_pem: str) -> ed25519.Ed25519PrivateKey:
+    """Parse and cache an Ed25519 private key from PEM."""
+    private_key = serialization.load_pem_private_key(
+        private_key_pem.encode("utf-8"),
+        password=None,
+    )
+    if not isinstance(private_key, ed25519.Ed25519PrivateKey):
+        raise PolicyVerificationError("Key is not Ed25519")
+    return private_key
+
+
+@lru_cache(maxsize=32)
+def _nacl_verify_key(public_key_pem: str) -> Any:
+    """Build a libsodium verify key from the raw public key bytes."""
+    assert nacl_signing is not None
+    raw = _load_public_key(public_key_pem).public_bytes(
+        encoding=serialization.Encoding.Raw,
+        format=serialization.PublicFormat.Raw,
+    )
+    return nacl_signing.VerifyKey(raw)
+
+
+@lru_cache(maxsize=32)
+def _nacl_signing_key(private_key_pem: str) -> Any:
+    """Build a libsodium signing key from the 32-byte PKCS8 seed."""
+    assert nacl_signing is not None
+    seed = _load_private_key(private_key_pem).private_bytes(
+        encoding=serialization.Encoding.Raw,
+        format=serialization.PrivateFormat.Raw,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    return nacl_signing.SigningKey(seed)
+
+
+def _policy_bytes(policy_json: str | bytes) -> bytes:
+    """Return the exact bytes to sign, encoding text as UTF-8."""
+    if isinstance(policy_json, bytes):
+        return policy_json
+    return policy_json.encode("utf-8")
+
+
 def verify_policy_signature(
-    policy_json: str,
+    policy_json: str | bytes,
     public_key_pem: str,
     signature_b64: str,
 ) -> bool:
@@ -40,7 +105,7 @@ def verify_policy_signature(
     This avoids JSON canonicalization ambiguity—sign what you store.
 
     Args:
-        policy_json: Raw JSON string of policy
+        policy_json: Raw JSON string of policy, or its exact UTF-8 bytes
         public_key_pem: PEM-encoded Ed25519 public key
         signature_b64: Base64-encoded signature
 
@@ -51,49 +116,79 @@ def verify_policy_signature(
         PolicyVerificationError: If verification fails
     """
     try:
-        # Load public key
-        pub_key = serialization.load_pem_public_key(public_key_pem.encode("utf-8"))
-
-        if not isinstance(pub_key, ed25519.Ed25519PublicKey):
-            raise PolicyVerificationError("Key is not Ed25519")
-
         # Decode signature
         signature = base64.b64decode(signature_b64)
-
-        # Verify
-        pub_key.verify(signature, policy_json.encode("utf-8"))
+        message = _policy_bytes(policy_json)
+
+        # Verify (libsodium when available, otherwise OpenSSL via cryptography)
+        if nacl_signing is not None:
+            verify_key = _nacl_verify_key(public_key_pem)
+            if len(signature) != ED25519_SIGNATURE_BYTES:
+                raise InvalidSignature()
+            verify_key.verify(message, signature)
+        else:
+            _load_public_key(public_key_pem).verify(signature, message)
         return True
 
     except InvalidSignature:
         logger.warning("Policy signature verification failed")
         return False
     except Exception as e:
+        if NaclBadSignatureError is not None and isinstance(e, NaclBadSignatureError):
+            logger.warning("Policy signature verification failed")
+            return False
         raise PolicyVerificationError(f"Verification error: {e}") from e
 
 
+def verify_batch(
+    items: list[tuple[str | bytes, str, str]],
+    max_workers: int | None = None,
+) -> list[bool]:
+    """
+    Verify several policy signatures concurrently.
+
+    Ed25519 verification runs in C with the GIL released, so a thread
+    pool scales across cores when many policies are checked at once.
+
+    Args:
+        items: Tuples of (policy_json, public_key_pem, signature_b64)
+        max_workers: Thread count (defaults to the number of CPUs)
+
+    Returns:
+        Verification result for each item, in input order
+
+    Raises:
+        PolicyVerificationError: If any item cannot be verified
+    """
+    if not items:
+        return []
+    if len(items) == 1:
+        return [verify_policy_signature(*items[0])]
+
+    workers = min(len(items), max_workers or os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda item: verify_policy_signature(*item), items))
+
+
 def sign_policy(
-    policy_json: str,
+    policy_json: str | bytes,
     private_key_pem: str,
 ) -> str:
     """
     Sign a policy with an Ed25519 private key.
 
     Args:
-        policy_json: Raw JSON string of policy
+        policy_json: Raw JSON string of policy, or its exact UTF-8 bytes
         private_key_pem: PEM-encoded Ed25519 private key
 
     Returns:
         Base64-encoded signature
     """
-    private_key = serialization.load_pem_private_key(
-        private_key_pem.encode("utf-8"),
-        password=None,
-    )
-
-    if not isinstance(private_key, ed25519.Ed25519PrivateKey):
-        raise PolicyVerificationError("Key is not Ed25519")
-
-    signature = private_key.sign(policy_json.encode("utf-8"))
+    message = _policy_bytes(policy_json)
+    if nacl_signing is not None:
+        signature = _nacl_signing_key(private_key_pem).sign(message).signature
+    else:
+        signature = _load_private_key(private_key_pem).sign(message)
     return base64.b64encode(signature).decode("ascii")
 
 
@@ -1,8 +1,11 @@
 """Safety Kernel - Multi-layer defense for AI agent operations."""
 
+import asyncio
 import hashlib
 import json
 import os
+import queue
+import threading
 import time
 import uuid
 from dataclasses import dataclass, field
@@ -30,6 +33,9 @@ fcntl = fcntl_module
 
 logger = get_logger(__name__)
 
+# Marks the end of the background audit writer's queue
+_WRITER_STOP = object()
+
 
 class RiskLevel(StrEnum):
     """Operation risk levels."""
@@ -111,6 +117,10 @@ class AuditLogger:
         self._log_path.parent.mkdir(parents=True, exist_ok=True)
         self._prev_hash = ""
         self._lock_supported = fcntl is not None
+        self._queue: queue.SimpleQueue[Any] | None = None
+        self._writer: threading.Thread | None = None
+        # Entries the background writer failed to persist (written only by it)
+        self._dropped_entries = 0
 
         if self._log_path.exists():
             try:
@@ -119,6 +129,17 @@ class AuditLogger:
             except OSError:
                 self._prev_hash = ""
 
+    @property
+    def dropped_entries(self) -> int:
+        """Number of queued entries the background writer failed to persist."""
+        return self._dropped_entries
+
+    @property
+    def is_healthy(self) -> bool:
+        """Whether every entry so far was persisted and the writer (if any) is running."""
+        writer = self._writer
+        return self._dropped_entries == 0 and (writer is None or writer.is_alive())
+
     def _compute_hash(self, data: dict[str, Any]) -> str:
         """Compute SHA-256 hash of entry data."""
         content = json.dumps(data, sort_keys=True)
@@ -195,23 +216,117 @@ class AuditLogger:
         if subject and "subject" not in entry:
             entry["subject"] = subject
 
-        with open(self._log_path, "a+b") as f:
-            self._acquire_lock(f)
-            try:
-                prev_hash = self._read_last_hash_locked(f) or self._prev_hash
+        if self._queue is not None:
+            # Snapshot now: the caller may still mutate result/extra, and values
+            # that cannot be encoded fail here, as in synchronous mode. Hashing
+            # and the fsync happen on the writer thread.
+            self._queue.put(json.loads(json.dumps(entry)))
+        else:
+            with open(self._log_path, "a+b") as f:
+                self._write_entries(f, [entry])
+        logger.debug("Audit entry logged", audit_event=event, tool=tool)
+
+    def _write_entries(self, file_obj: Any, entries: list[dict[str, Any]]) -> None:
+        """Chain, append and fsync entries under one lock and one write."""
+        self._acquire_lock(file_obj)
+        try:
+            prev_hash = self._read_last_hash_locked(file_obj) or self._prev_hash
+            lines = []
+            for entry in entries:
                 entry["prev_hash"] = prev_hash
-                entry["hash"] = self._compute_hash(entry)
+                prev_hash = entry["hash"] = self._compute_hash(entry)
+                lines.append(json.dumps(entry) + "\n")
 
-                f.seek(0, os.SEEK_END)
-                f.write((json.dumps(entry) + "\n").encode("utf-8"))
-                f.flush()
-                os.fsync(f.fileno())
-            finally:
-                self._release_lock(f)
+            file_obj.seek(0, os.SEEK_END)
+            file_obj.write("".join(lines).encode("utf-8"))
+            file_obj.flush()
+            os.fsync(file_obj.fileno())
+        finally:
+            self._release_lock(file_obj)
 
-        hash_value = entry.get("hash")
-        self._prev_hash = hash_value if isinstance(hash_value, str) else ""
-        logger.debug("Audit entry logged", audit_event=event, tool=tool)
+        self._prev_hash = prev_hash
+
+    def start_writer(self, batch_size: int = 64, batch_window: float = 0.005) -> None:
+        """
+        Move audit writes to a background thread.
+
+        After this, log() only queues the entry; the writer thread appends
+        queued entries in batches of up to ``batch_size`` collected within
+        ``batch_window`` seconds, with a single write and fsync per batch.
+
+        This gives up per-entry durability: log() returns before the entry
+        is on disk, and a failed write can no longer fail the caller's
+        operation. Such entries are counted in ``dropped_entries`` and
+        ``is_healthy`` turns false instead.
+
+        Args:
+            batch_size: Maximum entries per write
+            batch_window: Seconds to wait for more entries after the first
+        """
+        if self._writer is not None:
+            return
+        self._queue = queue.SimpleQueue()
+        self._writer = threading.Thread(
+            target=self._writer_loop,
+            args=(self._queue, batch_size, batch_window),
+            name="audit-writer",
+            daemon=True,
+        )
+        self._writer.start()
+
+    async def aclose(self) -> None:
+        """Flush queued entries and stop the background writer."""
+        writer, audit_queue = self._writer, self._queue
+        if writer is None or audit_queue is None:
+            return
+        # Entries logged from here on are written synchronously
+        self._writer = None
+        self._queue = None
+        audit_queue.put(_WRITER_STOP)
+        await asyncio.to_thread(writer.join)
+
+    def _writer_loop(
+        self,
+        audit_queue: queue.SimpleQueue[Any],
+        batch_size: int,
+        batch_window: float,
+    ) -> None:
+        f: Any = None
+        stopping = False
+        try:
+            while not stopping:
+                batch = [audit_queue.get()]
+                deadline = time.monotonic() + batch_window
+                while len(batch) < batch_size and batch[-1] is not _WRITER_STOP:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(audit_queue.get(timeout=timeout))
+                    except queue.Empty:
+                        break
+
+                stopping = batch[-1] is _WRITER_STOP
+                entries = batch[:-1] if stopping else batch
+                if not entries:
+                    continue
+                # Any failure drops the batch but keeps the thread alive, so
+                # later entries are still written or at least counted
+                try:
+                    if f is None:
+                        f = open(self._log_path, "a+b")
+                    self._write_entries(f, entries)
+                except Exception as e:
+                    self._dropped_entries += len(entries)
+                    logger.error(
+                        "Audit write failed",
+                        error=str(e),
+                        dropped=len(entries),
+                        dropped_total=self._dropped_entries,
+                    )
+        finally:
+            if f is not None:
+                f.close()
 
     def verify_chain(self) -> tuple[bool, list[int]]:
         """
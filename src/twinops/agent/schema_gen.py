@@ -34,9 +34,14 @@ XSD_TO_JSON_TYPE: dict[str, str] = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolSpec:
-    """Specification for an LLM-callable tool."""
+    """
+    Specification for an LLM-callable tool.
+
+    Specs are built once when operations load and then shared by the
+    capability index and every request, so they are immutable.
+    """
 
     name: str
     description: str
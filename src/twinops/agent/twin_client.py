@@ -185,7 +185,7 @@ class TwinClient:
         self._settings = settings
         self._timeout = aiohttp.ClientTimeout(total=settings.http_timeout)
         self._session: aiohttp.ClientSession | None = None
-        self._connector = None
+        self._ssl_context: ssl.SSLContext | None = None
         self._circuit_breaker = circuit_breaker or CircuitBreaker(
             failure_threshold=settings.twin_client_failure_threshold,
             recovery_timeout=settings.twin_client_recovery_timeout,
@@ -205,16 +205,33 @@ class TwinClient:
                 ssl_context.load_cert_chain(
                     settings.twin_tls_client_cert, settings.twin_tls_client_key
                 )
-            self._connector = aiohttp.TCPConnector(ssl=ssl_context)
+            self._ssl_context = ssl_context
 
     @property
     def circuit_breaker(self) -> CircuitBreaker:
         """Get the circuit breaker instance."""
         return self._circuit_breaker
 
+    def _new_session(self) -> aiohttp.ClientSession:
+        """
+        Create a session with a fresh pooled connector.
+
+        The session owns (and closes) its connector, so each session gets a
+        new one. Idle connections to the twin are kept for
+        ``twin_client_keepalive_timeout`` seconds so shadow reads between
+        chats reuse them instead of reconnecting.
+        """
+        connector = aiohttp.TCPConnector(
+            ssl=self._ssl_context if self._ssl_context is not None else True,
+            limit=self._settings.twin_client_pool_size,
+            keepalive_timeout=self._settings.twin_client_keepalive_timeout,
+            ttl_dns_cache=300,
+        )
+        return aiohttp.ClientSession(timeout=self._timeout, connector=connector)
+
     async def __aenter__(self) -> "TwinClient":
         """Enter async context."""
-        self._session = aiohttp.ClientSession(timeout=self._timeout, connector=self._connector)
+        self._session = self._new_session()
         return self
 
     async def __aexit__(
@@ -231,7 +248,7 @@ class TwinClient:
     def _ensure_session(self) -> aiohttp.ClientSession:
         """Ensure session exists."""
         if not self._session:
-            self._session = aiohttp.ClientSession(timeout=self._timeout, connector=self._connector)
+            self._session = self._new_session()
         return self._session
 
     async def _protected_request(
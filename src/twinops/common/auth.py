@@ -8,6 +8,7 @@ import ssl
 import time
 from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
@@ -23,7 +24,7 @@ from twinops.common.settings import Settings
 logger = get_logger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuthContext:
     """Authenticated request context."""
 
@@ -33,6 +34,10 @@ class AuthContext:
     fingerprint: str | None = None
 
 
+# Set on auth-exempt paths so request.state.auth is always present
+ANONYMOUS_AUTH = AuthContext(subject="", roles=(), method="header")
+
+
 class AuthError(Exception):
     """Authentication error with HTTP status."""
 
@@ -42,8 +47,38 @@ class AuthError(Exception):
         self.message = message
 
 
-def _parse_roles(value: str) -> tuple[str, ...]:
-    return tuple(role.strip() for role in value.split(",") if role.strip())
+@lru_cache(maxsize=512)
+def parse_roles(value: str) -> tuple[str, ...]:
+    """Parse a comma-separated roles header (cached; clients reuse few distinct values)."""
+    return tuple(role for role in (part.strip() for part in value.split(",")) if role)
+
+
+def header_roles(request: Request) -> tuple[str, ...]:
+    """Parse the X-Roles header straight from the ASGI scope."""
+    for key, value in request.scope["headers"]:
+        if key == b"x-roles":
+            return parse_roles(value.decode("latin-1"))
+    return ()
+
+
+def _identity_headers(request: Request) -> tuple[str, str | None]:
+    """
+    Read X-Roles and X-Subject in one pass over the raw ASGI headers.
+
+    Skips building Starlette's Headers object for header-mode auth, which
+    runs on every request.
+
+    Returns:
+        Tuple of (roles header or "", subject header or None)
+    """
+    roles: str | None = None
+    subject: str | None = None
+    for key, value in request.scope["headers"]:
+        if key == b"x-roles" and roles is None:
+            roles = value.decode("latin-1")
+        elif key == b"x-subject" and subject is None:
+            subject = value.decode("latin-1")
+    return roles or "", subject
 
 
 def _format_subject(subject: Iterable[Iterable[tuple[str, str]]]) -> str:
@@ -114,9 +149,9 @@ def _extract_mtls_identity(request: Request, settings: Settings) -> tuple[str |
 def authenticate_request(request: Request, settings: Settings) -> AuthContext:
     """Authenticate a request and return an AuthContext."""
     if settings.auth_mode == "none":
-        roles_header = request.headers.get("X-Roles", "")
-        header_roles = _parse_roles(roles_header) or settings.default_roles
-        header_subject = request.headers.get("X-Subject", "anonymous")
+        roles_header, subject_header = _identity_headers(request)
+        header_roles = parse_roles(roles_header) or settings.default_roles
+        header_subject = "anonymous" if subject_header is None else subject_header
         return AuthContext(subject=header_subject, roles=header_roles, method="header")
 
     mtls_subject, fingerprint = _extract_mtls_identity(request, settings)
@@ -149,10 +184,11 @@ class AuthMiddleware(BaseHTTPMiddleware):
     def __init__(self, app: ASGIApp, settings: Settings) -> None:
         super().__init__(app)
         self._settings = settings
-        self._exempt_paths = set(settings.auth_exempt_paths)
+        self._exempt_paths = frozenset(settings.auth_exempt_paths)
 
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        if request.url.path in self._exempt_paths:
+        if request.scope["path"] in self._exempt_paths:
+            request.state.auth = ANONYMOUS_AUTH
             return await call_next(request)
 
         try:
@@ -172,13 +208,13 @@ class HmacAuthMiddleware(BaseHTTPMiddleware):
     def __init__(self, app: ASGIApp, settings: Settings) -> None:
         super().__init__(app)
         self._settings = settings
-        self._exempt_paths = set(settings.opservice_auth_exempt_paths)
+        self._exempt_paths = frozenset(settings.opservice_auth_exempt_paths)
 
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
         if self._settings.opservice_auth_mode != "hmac":
             return await call_next(request)
 
-        if request.url.path in self._exempt_paths:
+        if request.scope["path"] in self._exempt_paths:
             return await call_next(request)
 
         secret = self._settings.opservice_hmac_secret
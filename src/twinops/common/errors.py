@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import json
+from functools import lru_cache
 from typing import Any
 
 from starlette.responses import JSONResponse
 
+from twinops.common.http import ORJSONResponse
+
 
 class ErrorCode:
     INVALID_JSON = "invalid_json"
@@ -19,18 +23,43 @@ class ErrorCode:
     BAD_REQUEST = "bad_request"
 
 
+class _PrerenderedJSONResponse(JSONResponse):
+    """JSONResponse whose content is already-encoded JSON bytes."""
+
+    def render(self, content: Any) -> bytes:
+        return bytes(content)
+
+
+@lru_cache(maxsize=128)
+def _error_body(
+    code: str,
+    message: str,
+    details: tuple[tuple[str, str], ...] = (),
+) -> bytes:
+    """Encode an error payload (handlers reuse a small set of constant errors)."""
+    error: dict[str, Any] = {"code": code, "message": message}
+    if details:
+        error["details"] = dict(details)
+    payload = {"error": error}
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
 def error_response(
     code: str,
     message: str,
     status_code: int,
     details: dict[str, Any] | None = None,
 ) -> JSONResponse:
-    payload: dict[str, dict[str, Any]] = {
-        "error": {
-            "code": code,
-            "message": message,
+    # Only string details are cached: equal keys must mean equal JSON, and
+    # 1, 1.0 and True compare (and hash) equal while encoding differently
+    if details and not all(isinstance(value, str) for value in details.values()):
+        payload: dict[str, dict[str, Any]] = {
+            "error": {
+                "code": code,
+                "message": message,
+                "details": details,
+            }
         }
-    }
-    if details:
-        payload["error"]["details"] = details
-    return JSONResponse(payload, status_code=status_code)
+        return ORJSONResponse(payload, status_code=status_code)
+    body = _error_body(code, message, tuple(details.items()) if details else ())
+    return _PrerenderedJSONResponse(body, status_code=status_code)
@@ -5,14 +5,40 @@ from __future__ import annotations
 import contextvars
 import uuid
 from dataclasses import dataclass
+from typing import Any
 
+import orjson
 import structlog
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import JSONResponse, Response
 from starlette.types import ASGIApp
 
 
+class ORJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson.
+
+    Dataclass instances in the content are encoded as JSON objects of their
+    fields; orjson does this directly from the instance, without a dict.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+async def read_json(request: Request) -> Any:
+    """
+    Decode a JSON request body with orjson.
+
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON (orjson's
+            decode error is a subclass)
+    """
+    body = await request.body()
+    return orjson.loads(body)
+
+
 @dataclass(frozen=True)
 class RequestIdentity:
     """Identity context for outbound requests."""
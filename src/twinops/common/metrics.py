@@ -2,6 +2,7 @@
 
 import os
 import time
+from collections.abc import Iterable
 
 from prometheus_client import (
     CollectorRegistry,
@@ -211,12 +212,14 @@ def update_pending_approvals(count: int) -> None:
 class MetricsMiddleware(BaseHTTPMiddleware):
     """HTTP request metrics middleware."""
 
-    def __init__(self, app: ASGIApp, exclude_paths: list[str] | None = None) -> None:
+    def __init__(self, app: ASGIApp, exclude_paths: Iterable[str] | None = None) -> None:
         super().__init__(app)
-        self._exclude_paths = set(exclude_paths or [])
+        self._exclude_paths = frozenset(exclude_paths or ())
 
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        if request.url.path in self._exclude_paths:
+        # The raw scope path avoids building a URL object per request
+        path: str = request.scope["path"]
+        if path in self._exclude_paths:
             return await call_next(request)
 
         start = time.perf_counter()
@@ -226,7 +229,7 @@ class MetricsMiddleware(BaseHTTPMiddleware):
             duration = time.perf_counter() - start
             record_http_request(
                 method=request.method,
-                endpoint=request.url.path,
+                endpoint=path,
                 status=500,
                 latency=duration,
             )
@@ -235,7 +238,7 @@ class MetricsMiddleware(BaseHTTPMiddleware):
         duration = time.perf_counter() - start
         record_http_request(
             method=request.method,
-            endpoint=request.url.path,
+            endpoint=path,
             status=response.status_code,
             latency=duration,
         )
@@ -2,12 +2,14 @@
 
 import time
 from collections import defaultdict
+from collections.abc import Iterable
 
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import Response
 from starlette.types import ASGIApp
 
+from twinops.common.http import ORJSONResponse
 from twinops.common.logging import get_logger
 
 logger = get_logger(__name__)
@@ -152,7 +154,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         app: ASGIApp,
         requests_per_minute: float = 60.0,
         burst_size: float | None = None,
-        exclude_paths: list[str] | None = None,
+        exclude_paths: Iterable[str] | None = None,
         client_id_header: str = "X-API-Key",
     ) -> None:
         """
@@ -170,7 +172,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             requests_per_minute=requests_per_minute,
             burst_size=burst_size,
         )
-        self._exclude_paths = set(exclude_paths or ["/health", "/ready", "/metrics"])
+        self._exclude_paths = frozenset(exclude_paths or ("/health", "/ready", "/metrics"))
         self._client_id_header = client_id_header
 
     def _get_client_id(self, request: Request) -> str:
@@ -198,7 +200,8 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     ) -> Response:
         """Process request with rate limiting."""
         # Skip rate limiting for excluded paths
-        if request.url.path in self._exclude_paths:
+        path: str = request.scope["path"]
+        if path in self._exclude_paths:
             return await call_next(request)
 
         client_id = self._get_client_id(request)
@@ -209,10 +212,10 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             logger.warning(
                 "Rate limit exceeded",
                 client_id=client_id,
-                path=request.url.path,
+                path=path,
                 retry_after=retry_after_int,
             )
-            return JSONResponse(
+            return ORJSONResponse(
                 {
                     "error": "Rate limit exceeded",
                     "retry_after": retry_after_int,
@@ -227,7 +230,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 def create_rate_limit_middleware(
     requests_per_minute: float = 60.0,
     burst_size: float | None = None,
-    exclude_paths: list[str] | None = None,
+    exclude_paths: Iterable[str] | None = None,
 ) -> type[RateLimitMiddleware]:
     """
     Factory function to create rate limit middleware with configuration.
@@ -140,6 +140,34 @@ class Settings(BaseSettings):
         default=True,
         description="Enable fallback to rules-based client when LLM circuit opens",
     )
+    llm_response_cache_size: int = Field(
+        default=0,
+        description="Max cached LLM responses for identical requests (0 = disabled)",
+    )
+    llm_semantic_cache_size: int = Field(
+        default=0,
+        description="Max text-only LLM responses reused for paraphrased requests (0 = disabled)",
+    )
+    llm_semantic_cache_threshold: float = Field(
+        default=0.92,
+        description="Minimum cosine similarity for a semantic LLM cache hit",
+    )
+    chat_cache_size: int = Field(
+        default=0,
+        description="Max cached text-only /chat replies per (roles, message) (0 = disabled)",
+    )
+    chat_cache_ttl_seconds: float = Field(
+        default=60.0,
+        description="TTL for cached /chat replies",
+    )
+    llm_prompt_cache: bool = Field(
+        default=True,
+        description="Use Anthropic prompt caching for the system prompt and tool definitions",
+    )
+    llm_warm_up: bool = Field(
+        default=True,
+        description="Open the LLM provider connection during startup",
+    )
 
     # Agent
     agent_port: int = Field(
@@ -160,7 +188,19 @@ class Settings(BaseSettings):
     )
     agent_workers: int = Field(
         default=1,
-        description="Number of Uvicorn worker processes for the agent API",
+        description="Number of Uvicorn worker processes for the agent API (0 = one per CPU)",
+    )
+    agent_loop: Literal["auto", "asyncio", "uvloop"] = Field(
+        default="auto",
+        description="Uvicorn event loop (auto uses uvloop when installed)",
+    )
+    agent_http: Literal["auto", "h11", "httptools"] = Field(
+        default="auto",
+        description="Uvicorn HTTP parser (auto uses httptools when installed)",
+    )
+    agent_gzip_min_size: int = Field(
+        default=1024,
+        description="Gzip agent API responses of at least this many bytes (0 = disabled)",
     )
     metrics_multiprocess_dir: str | None = Field(
         default=None,
@@ -234,6 +274,14 @@ class Settings(BaseSettings):
         default="audit_logs/audit.jsonl",
         description="Path to the audit log file",
     )
+    audit_background_writes: bool = Field(
+        default=False,
+        description=(
+            "Write audit entries from a background thread in batched appends; "
+            "trades per-entry durability for throughput (failed writes are "
+            "counted and mark the agent not ready instead of failing the operation)"
+        ),
+    )
     policy_verification_required: bool = Field(
         default=True,
         description="Whether to require policy signature verification",
@@ -344,6 +392,14 @@ class Settings(BaseSettings):
         default=None,
         description="Max concurrent TwinClient HTTP requests (None = unlimited)",
     )
+    twin_client_pool_size: int = Field(
+        default=128,
+        description="Max pooled TwinClient connections (0 = unlimited)",
+    )
+    twin_client_keepalive_timeout: float = Field(
+        default=300.0,
+        description="Seconds an idle TwinClient connection stays in the pool",
+    )
     tool_execution_timeout: float | None = Field(
         default=None,
         description="Max seconds to wait for a tool execution before timing out",
@@ -406,7 +462,15 @@ class Settings(BaseSettings):
     )
     startup_retry_interval: float = Field(
         default=5.0,
-        description="Interval between dependency check retries during startup",
+        description="Initial interval between dependency check retries during startup",
+    )
+    startup_retry_max_interval: float = Field(
+        default=30.0,
+        description="Maximum interval between dependency check retries (backoff doubles)",
+    )
+    startup_retry_jitter: float = Field(
+        default=0.3,
+        description="Jitter ratio for dependency check retry backoff",
     )
     startup_validate_aas: bool = Field(
         default=True,
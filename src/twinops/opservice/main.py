@@ -17,7 +17,7 @@ from starlette.routing import Route
 
 from twinops.common.auth import AuthMiddleware, HmacAuthMiddleware
 from twinops.common.errors import ErrorCode, error_response
-from twinops.common.http import RequestIdMiddleware
+from twinops.common.http import ORJSONResponse, RequestIdMiddleware, read_json
 from twinops.common.logging import get_logger, setup_logging
 from twinops.common.metrics import MetricsMiddleware, metrics_endpoint
 from twinops.common.ratelimit import RateLimitMiddleware
@@ -281,7 +281,7 @@ class OperationServer:
         operation = request.path_params.get("operation", "")
 
         try:
-            body = await request.json()
+            body = await read_json(request)
         except json.JSONDecodeError:
             return error_response(
                 ErrorCode.INVALID_JSON,
@@ -312,7 +312,7 @@ class OperationServer:
         )
 
         status_code = 200 if simulate else 202
-        return JSONResponse(result, status_code=status_code)
+        return ORJSONResponse(result, status_code=status_code)
 
     async def handle_get_job(self, request: Request) -> JSONResponse:
         """Get job status."""
@@ -326,7 +326,7 @@ class OperationServer:
                 status_code=404,
             )
 
-        return JSONResponse(
+        return ORJSONResponse(
             {
                 "job_id": job.job_id,
                 "operation": job.operation,
@@ -344,7 +344,7 @@ class OperationServer:
     async def handle_list_jobs(self, _request: Request) -> JSONResponse:
         """List all jobs."""
         jobs = self._executor.get_all_jobs()
-        return JSONResponse(
+        return ORJSONResponse(
             {
                 "jobs": [
                     {
@@ -363,7 +363,7 @@ class OperationServer:
 
     async def handle_health(self, _request: Request) -> JSONResponse:
         """Health check."""
-        return JSONResponse({"status": "healthy"})
+        return ORJSONResponse({"status": "healthy"})
 
 
 def create_app(settings: Settings | None = None) -> Starlette:
@@ -19,7 +19,12 @@ from twinops.common.basyx_topics import (
     b64url_encode_nopad,
 )
 from twinops.common.errors import ErrorCode, error_response
-from twinops.common.http import RequestIdMiddleware, get_request_id
+from twinops.common.http import (
+    ORJSONResponse,
+    RequestIdMiddleware,
+    get_request_id,
+    read_json,
+)
 from twinops.common.logging import get_logger, setup_logging
 from twinops.common.metrics import MetricsMiddleware, metrics_endpoint
 from twinops.common.mqtt import MqttClient
@@ -306,7 +311,7 @@ class SandboxServer:
                 status_code=503,
             )
         shells = await self._repo.get_all_shells()
-        return JSONResponse({"result": shells})
+        return ORJSONResponse({"result": shells})
 
     async def handle_get_shell(self, request: Request) -> JSONResponse:
         """GET /shells/{aasId}"""
@@ -320,7 +325,7 @@ class SandboxServer:
         shell = await self._repo.get_shell(aas_id)
         if not shell:
             return error_response(ErrorCode.NOT_FOUND, "Not found", status_code=404)
-        return JSONResponse(shell)
+        return ORJSONResponse(shell)
 
     async def handle_get_shell_refs(self, request: Request) -> JSONResponse:
         """GET /shells/{aasId}/submodel-refs"""
@@ -332,7 +337,7 @@ class SandboxServer:
             )
         aas_id = self._decode_path_id(request.path_params["aas_id"])
         refs = await self._repo.get_shell_submodel_refs(aas_id)
-        return JSONResponse({"result": refs})
+        return ORJSONResponse({"result": refs})
 
     async def handle_get_submodels(self, _request: Request) -> JSONResponse:
         """GET /submodels"""
@@ -343,7 +348,7 @@ class SandboxServer:
                 status_code=503,
             )
         submodels = await self._repo.get_all_submodels()
-        return JSONResponse({"result": submodels})
+        return ORJSONResponse({"result": submodels})
 
     async def handle_get_submodel(self, request: Request) -> JSONResponse:
         """GET /submodels/{smId}"""
@@ -357,7 +362,7 @@ class SandboxServer:
         submodel = await self._repo.get_submodel(sm_id)
         if not submodel:
             return error_response(ErrorCode.NOT_FOUND, "Not found", status_code=404)
-        return JSONResponse(submodel)
+        return ORJSONResponse(submodel)
 
     async def handle_get_element(self, request: Request) -> JSONResponse:
         """GET /submodels/{smId}/submodel-elements/{path}"""
@@ -372,7 +377,7 @@ class SandboxServer:
         element = await self._repo.get_element(sm_id, path)
         if not element:
             return error_response(ErrorCode.NOT_FOUND, "Not found", status_code=404)
-        return JSONResponse(element)
+        return ORJSONResponse(element)
 
     async def handle_get_value(self, request: Request) -> JSONResponse:
         """GET /submodels/{smId}/submodel-elements/{path}/$value"""
@@ -385,7 +390,7 @@ class SandboxServer:
         sm_id = self._decode_path_id(request.path_params["sm_id"])
         path = request.path_params["path"]
         value = await self._repo.get_element_value(sm_id, path)
-        return JSONResponse(value)
+        return ORJSONResponse(value)
 
     async def handle_set_value(self, request: Request) -> Response:
         """PUT /submodels/{smId}/submodel-elements/{path}/$value"""
@@ -397,14 +402,14 @@ class SandboxServer:
             )
         sm_id = self._decode_path_id(request.path_params["sm_id"])
         path = request.path_params["path"]
-        value = await request.json()
+        value = await read_json(request)
         if await self._repo.set_element_value(sm_id, path, value):
             return Response(status_code=204)
         return error_response(ErrorCode.NOT_FOUND, "Not found", status_code=404)
 
     async def handle_health(self, _request: Request) -> JSONResponse:
         """Health check."""
-        return JSONResponse({"status": "healthy"})
+        return ORJSONResponse({"status": "healthy"})
 
     def _decode_path_id(self, encoded: str) -> str:
         """Decode base64url encoded ID from path."""
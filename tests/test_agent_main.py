@@ -0,0 +1,301 @@
+"""Tests for the agent HTTP application."""
+
+import json
+import math
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from twinops.agent.main import (
+    DirectRouteMiddleware,
+    GracefulShutdown,
+    InFlightMiddleware,
+    create_app,
+)
+from twinops.agent.orchestrator import AgentResponse
+
+# TestClient is used without a context manager throughout, so the lifespan
+# (and with it the twin, MQTT and LLM startup) never runs
+
+
+def _middleware_classes(app: Starlette) -> list[type]:
+    return [m.cls for m in app.user_middleware]
+
+
+class TestInFlightMiddleware:
+    """Test shutdown gating and drain accounting."""
+
+    def test_rejects_new_requests_during_shutdown(self, settings):
+        """Test new requests get a 503 asking the client to close the connection."""
+        app = create_app(settings)
+        app.state.server._shutdown.trigger_shutdown()
+        client = TestClient(app)
+
+        response = client.post("/chat", json={"message": "status"})
+
+        assert response.status_code == 503
+        assert response.headers["connection"] == "close"
+        assert response.json()["error"]["code"] == "server_shutting_down"
+
+    def test_probes_served_during_shutdown(self, settings):
+        """Test probe paths are not gated by shutdown."""
+        app = create_app(settings)
+        app.state.server._shutdown.trigger_shutdown()
+        client = TestClient(app)
+
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        assert response.json()["shutting_down"] is True
+
+    def test_in_flight_request_closes_connection(self):
+        """Test a request running when shutdown starts finishes with Connection: close."""
+        shutdown = GracefulShutdown()
+        seen = []
+
+        async def endpoint(_request: Request) -> PlainTextResponse:
+            seen.append(shutdown.active_requests)
+            shutdown.trigger_shutdown()
+            return PlainTextResponse("done")
+
+        app = Starlette(routes=[Route("/work", endpoint)])
+        app.add_middleware(InFlightMiddleware, shutdown=shutdown)
+        client = TestClient(app)
+
+        response = client.get("/work")
+
+        assert response.status_code == 200
+        assert response.headers["connection"] == "close"
+        assert seen == [1]
+        assert shutdown.active_requests == 0
+
+    def test_excluded_paths_not_counted(self):
+        """Test excluded paths bypass the request counter."""
+        shutdown = GracefulShutdown()
+        seen = []
+
+        async def endpoint(_request: Request) -> PlainTextResponse:
+            seen.append(shutdown.active_requests)
+            return PlainTextResponse("ok")
+
+        app = Starlette(routes=[Route("/health", endpoint)])
+        app.add_middleware(InFlightMiddleware, shutdown=shutdown, exclude_paths={"/health"})
+        client = TestClient(app)
+
+        client.get("/health")
+
+        assert seen == [0]
+
+
+class TestDirectRouteMiddleware:
+    """Test the /metrics fast path and when it bypasses auth."""
+
+    def test_installed_without_auth(self, settings):
+        """Test /metrics is served directly when auth is disabled."""
+        app = create_app(settings)
+
+        assert DirectRouteMiddleware in _middleware_classes(app)
+        response = TestClient(app).get("/metrics")
+        assert response.status_code == 200
+
+    def test_not_installed_when_metrics_requires_auth(self, settings):
+        """Test /metrics stays behind mTLS unless it is exempt."""
+        app = create_app(settings.model_copy(update={"auth_mode": "mtls"}))
+
+        assert DirectRouteMiddleware not in _middleware_classes(app)
+        response = TestClient(app).get("/metrics")
+        assert response.status_code == 401
+
+    def test_installed_when_metrics_exempt(self, settings):
+        """Test an auth-exempt /metrics is served directly under mTLS."""
+        app = create_app(
+            settings.model_copy(
+                update={
+                    "auth_mode": "mtls",
+                    "auth_exempt_paths": ("/health", "/ready", "/metrics"),
+                }
+            )
+        )
+
+        assert DirectRouteMiddleware in _middleware_classes(app)
+        response = TestClient(app).get("/metrics")
+        assert response.status_code == 200
+
+    def test_skips_inner_middleware_for_get_only(self):
+        """Test only GET and HEAD on the exact path skip the inner stack."""
+
+        async def direct(_request: Request) -> PlainTextResponse:
+            return PlainTextResponse("direct")
+
+        async def routed(_request: Request) -> PlainTextResponse:
+            return PlainTextResponse("routed")
+
+        app = Starlette(
+            routes=[
+                Route("/metrics", routed, methods=["GET", "POST"]),
+                Route("/metrics/extra", routed),
+            ]
+        )
+        app.add_middleware(DirectRouteMiddleware, path="/metrics", endpoint=direct)
+        client = TestClient(app)
+
+        assert client.get("/metrics").text == "direct"
+        assert client.post("/metrics").text == "routed"
+        assert client.get("/metrics/extra").text == "routed"
+
+
+class TestHealth:
+    """Test the spliced /health body."""
+
+    def test_body_is_valid_json(self, settings):
+        """Test the body without shadow twin values."""
+        client = TestClient(create_app(settings))
+
+        body = json.loads(client.get("/health").content)
+
+        assert body["status"] == "healthy"
+        assert body["shutting_down"] is False
+        assert isinstance(body["uptime"], float)
+        assert "shadow_freshness_seconds" not in body
+
+    @pytest.mark.parametrize(
+        ("freshness", "expected"),
+        [(2.345, 2.3), (math.inf, None), (math.nan, None)],
+    )
+    def test_shadow_freshness(self, settings, freshness, expected):
+        """Test non-finite freshness values are encoded as null."""
+        app = create_app(settings)
+        app.state.server._shadow = MagicMock(
+            is_initialized=True,
+            freshness_seconds=freshness,
+            event_count=3,
+        )
+        client = TestClient(app)
+
+        body = json.loads(client.get("/health").content)
+
+        assert body["shadow_freshness_seconds"] == expected
+        assert body["shadow_event_count"] == 3
+
+
+class TestOpenApi:
+    """Test /openapi.json caching headers."""
+
+    def test_etag_revalidation(self, settings):
+        """Test matching If-None-Match values get an empty 304."""
+        client = TestClient(create_app(settings))
+
+        first = client.get("/openapi.json")
+        etag = first.headers["etag"]
+
+        assert first.status_code == 200
+        assert first.json()["openapi"].startswith("3.1")
+        for value in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+            response = client.get("/openapi.json", headers={"If-None-Match": value})
+            assert response.status_code == 304
+            assert response.content == b""
+            assert response.headers["etag"] == etag
+
+    def test_etag_mismatch(self, settings):
+        """Test a stale ETag gets the full body."""
+        client = TestClient(create_app(settings))
+
+        response = client.get("/openapi.json", headers={"If-None-Match": '"stale"'})
+
+        assert response.status_code == 200
+        assert response.json()["info"]
+
+
+class TestReady:
+    """Test the state-keyed /ready body cache."""
+
+    def test_reuses_body_until_state_changes(self, settings):
+        """Test unchanged state reuses the body and a change re-renders it."""
+        app = create_app(settings)
+        server = app.state.server
+        client = TestClient(app)
+
+        first = client.get("/ready")
+        cached = server._ready_cache
+
+        assert first.status_code == 503
+        assert first.json()["status"] == "not_ready"
+        assert client.get("/ready").content == first.content
+        assert server._ready_cache is cached
+
+        server._initialized = True
+        server._orchestrator = MagicMock()
+        server._mqtt_client = MagicMock(is_connected=True)
+        server._shadow = MagicMock(is_initialized=False)
+        ready = client.get("/ready")
+
+        assert ready.status_code == 200
+        assert ready.json()["status"] == "ready"
+        assert server._ready_cache is not cached
+
+    def test_unhealthy_audit_log_fails_readiness(self, settings):
+        """Test the cached ready body is replaced when the audit log turns unhealthy."""
+        app = create_app(settings)
+        server = app.state.server
+        server._initialized = True
+        server._orchestrator = MagicMock()
+        server._mqtt_client = MagicMock(is_connected=True)
+        server._audit = MagicMock(is_healthy=True)
+        client = TestClient(app)
+
+        assert client.get("/ready").status_code == 200
+
+        server._audit.is_healthy = False
+        response = client.get("/ready")
+
+        assert response.status_code == 503
+        assert response.json()["checks"]["audit_log"] is False
+
+
+class TestChatCache:
+    """Test the /chat response cache."""
+
+    @staticmethod
+    def _app(settings, response: AgentResponse) -> tuple[Starlette, AsyncMock]:
+        app = create_app(settings.model_copy(update={"chat_cache_size": 8}))
+        process_message = AsyncMock(return_value=response)
+        app.state.server._orchestrator = MagicMock(process_message=process_message)
+        return app, process_message
+
+    def test_cacheable_reply_replayed(self, settings):
+        """Test a cacheable reply is served from cache for the same roles and message."""
+        app, process_message = self._app(settings, AgentResponse(reply="ok", cacheable=True))
+        client = TestClient(app)
+
+        first = client.post("/chat", json={"message": "status"})
+        second = client.post("/chat", json={"message": "status"})
+
+        assert process_message.await_count == 1
+        assert second.json() == first.json()
+        assert second.json()["reply"] == "ok"
+
+    def test_miss_on_other_message_or_roles(self, settings):
+        """Test the cache key covers both the message and the caller's roles."""
+        app, process_message = self._app(settings, AgentResponse(reply="ok", cacheable=True))
+        client = TestClient(app)
+
+        client.post("/chat", json={"message": "status"})
+        client.post("/chat", json={"message": "other"})
+        client.post("/chat", json={"message": "status"}, headers={"X-Roles": "maintenance"})
+
+        assert process_message.await_count == 3
+
+    def test_non_cacheable_reply_not_stored(self, settings):
+        """Test replies not marked cacheable are recomputed every time."""
+        app, process_message = self._app(settings, AgentResponse(reply="done"))
+        client = TestClient(app)
+
+        client.post("/chat", json={"message": "start pump"})
+        client.post("/chat", json={"message": "start pump"})
+
+        assert process_message.await_count == 2
@@ -0,0 +1,49 @@
+"""Tests for agent API authentication."""
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from twinops.common.auth import ANONYMOUS_AUTH, AuthMiddleware
+
+
+class TestAuthExemptPaths:
+    """Test the auth context on exempt paths."""
+
+    def test_exempt_path_gets_anonymous_auth(self, settings):
+        """Test exempt paths see ANONYMOUS_AUTH even when mTLS is required."""
+        seen = []
+
+        async def endpoint(request: Request) -> JSONResponse:
+            seen.append(request.state.auth)
+            return JSONResponse({})
+
+        app = Starlette(routes=[Route("/health", endpoint), Route("/chat", endpoint)])
+        mtls_settings = settings.model_copy(update={"auth_mode": "mtls"})
+        app.add_middleware(AuthMiddleware, settings=mtls_settings)
+        client = TestClient(app)
+
+        assert client.get("/health").status_code == 200
+        assert client.get("/chat").status_code == 401
+        assert seen == [ANONYMOUS_AUTH]
+        assert seen[0] is ANONYMOUS_AUTH
+
+    def test_header_mode_sets_auth(self, settings):
+        """Test non-exempt paths get an AuthContext built from the headers."""
+        seen = []
+
+        async def endpoint(request: Request) -> JSONResponse:
+            seen.append(request.state.auth)
+            return JSONResponse({})
+
+        app = Starlette(routes=[Route("/chat", endpoint)])
+        app.add_middleware(AuthMiddleware, settings=settings)
+        client = TestClient(app)
+
+        client.get("/chat", headers={"X-Roles": "operator, maintenance", "X-Subject": "alice"})
+
+        assert seen[0].roles == ("operator", "maintenance")
+        assert seen[0].subject == "alice"
+        assert seen[0].method == "header"
@@ -1,8 +1,14 @@
 """Tests for capability index."""
 
+import numpy as np
 import pytest
 
-from twinops.agent.capabilities import CapabilityIndex, HybridCapabilityIndex
+from twinops.agent import capabilities
+from twinops.agent.capabilities import (
+    CapabilityIndex,
+    HybridCapabilityIndex,
+    Int8EmbeddingCapabilityIndex,
+)
 from twinops.agent.schema_gen import ToolSpec
 
 
@@ -129,6 +135,14 @@ class TestCapabilityIndex:
         results = index.search("anything")
         assert len(results) == 0
 
+    def test_blank_query_returns_nothing(self, sample_tools):
+        """Test a blank query matches no tools, whatever the corpus size."""
+        index = CapabilityIndex(sample_tools)
+
+        assert index.search("   ", top_k=10) == []
+        assert index.search("", top_k=2) == []
+        assert index.search_batch(["   "], top_k=10) == [[]]
+
     def test_add_tools(self, sample_tools):
         """Test adding tools incrementally."""
         index = CapabilityIndex()
@@ -139,6 +153,51 @@ class TestCapabilityIndex:
         index.add_tools(sample_tools[2:])
         assert index.tool_count == 5
 
+    def test_search_batch_matches_search(self, sample_tools):
+        """Test batched search returns the same hits as individual searches."""
+        index = CapabilityIndex(sample_tools)
+        queries = ["start the pump", "set speed to 1200 RPM", "what is the temperature"]
+
+        batched = index.search_batch(queries, top_k=3)
+
+        assert len(batched) == len(queries)
+        for query, hits in zip(queries, batched):
+            expected = index.search(query, top_k=3)
+            assert [h.tool.name for h in hits] == [h.tool.name for h in expected]
+
+    def test_search_raw(self, sample_tools):
+        """Test raw search returns positions and scores matching search."""
+        index = CapabilityIndex(sample_tools)
+
+        indices, scores = index.search_raw("set speed to 1200 RPM", top_k=3)
+        hits = index.search("set speed to 1200 RPM", top_k=3)
+
+        all_tools = index.get_all_tools()
+        assert [all_tools[i].name for i in indices] == [h.tool.name for h in hits]
+        assert list(scores) == pytest.approx([h.score for h in hits])
+
+    def test_repeated_query_uses_cache(self, sample_tools):
+        """Test repeated queries reuse the transformed query vector."""
+        index = CapabilityIndex(sample_tools)
+
+        first = index.search("Start the pump", top_k=3)
+        second = index.search("  start the PUMP ", top_k=3)
+
+        assert [r.tool.name for r in first] == [r.tool.name for r in second]
+        assert len(index._query_cache) == 1
+
+    def test_query_cache_cleared_on_reindex(self, sample_tools):
+        """Test the query cache is invalidated when tools change."""
+        index = CapabilityIndex(sample_tools[:2])
+        index.search("set speed", top_k=3)
+        assert len(index._query_cache) == 1
+
+        index.set_tools(sample_tools)
+        assert len(index._query_cache) == 0
+
+        results = index.search("set speed", top_k=3)
+        assert results[0].tool.name == "SetSpeed"
+
 
 class TestHybridCapabilityIndex:
     """Test hybrid index with priority tools."""
@@ -165,3 +224,69 @@ class TestHybridCapabilityIndex:
         results = index.search("start pump", top_k=5)
 
         assert results[0].tool.name == "GetPressure"
+
+    def test_batch_matches_single_search(self, sample_tools):
+        """Test batched searches keep priority tools like search() does."""
+        index = HybridCapabilityIndex(
+            tools=sample_tools,
+            always_include=["GetPressure"],
+        )
+        queries = ["start pump", "set speed"]
+
+        batched = index.search_batch(queries, top_k=3)
+
+        for query, hits in zip(queries, batched, strict=True):
+            assert hits[0].tool.name == "GetPressure"
+            assert [h.tool.name for h in hits] == [
+                h.tool.name for h in index.search(query, top_k=3)
+            ]
+
+
+def _keyword_encoder(texts: list[str]) -> np.ndarray:
+    """Deterministic toy encoder: one dimension per keyword."""
+    keywords = ["start", "stop", "pump", "speed", "temperature", "pressure"]
+    return np.array(
+        [[float(text.lower().count(k)) for k in keywords] for text in texts],
+        dtype=np.float32,
+    )
+
+
+class TestInt8EmbeddingCapabilityIndex:
+    """Test the int8-quantized embedding index."""
+
+    def test_search_ranks_by_embedding(self, sample_tools):
+        """Test that quantized scores rank the matching tool first."""
+        index = Int8EmbeddingCapabilityIndex(sample_tools, encoder=_keyword_encoder)
+
+        results = index.search("what is the temperature", top_k=3)
+
+        assert results[0].tool.name == "GetTemperature"
+        assert results[0].score == pytest.approx(1.0, abs=0.02)
+
+    def test_empty_index(self):
+        """Test empty embedding index behavior."""
+        index = Int8EmbeddingCapabilityIndex(encoder=_keyword_encoder)
+
+        assert index.search("anything") == []
+
+    def test_blocked_scoring_matches_float(self, sample_tools, monkeypatch):
+        """Test scoring in row blocks matches the dequantized float product."""
+        monkeypatch.setattr(capabilities, "_INT8_SCORE_BLOCK_ROWS", 2)
+        index = Int8EmbeddingCapabilityIndex(sample_tools, encoder=_keyword_encoder)
+        queries = ["start the pump", "pump pressure", "stop"]
+
+        scores = index._score_queries(queries, top_k=3)
+        q_quant, q_scale = capabilities._quantize_int8(index._encode(queries))
+        expected = (index._quantized * index._scale[:, None]).astype(np.float32) @ (
+            q_quant * q_scale[:, None]
+        ).T.astype(np.float32)
+
+        assert scores.dtype == np.float32
+        assert scores == pytest.approx(expected, rel=1e-5, abs=1e-6)
+
+    def test_no_tfidf_state(self, sample_tools):
+        """Test the embedding index does not build the TF-IDF vectorizer."""
+        index = Int8EmbeddingCapabilityIndex(sample_tools, encoder=_keyword_encoder)
+
+        assert not hasattr(index, "_vectorizer")
+        assert not hasattr(index, "_query_cache")
@@ -0,0 +1,48 @@
+"""Tests for shared error responses."""
+
+import json
+
+from twinops.common.errors import ErrorCode, error_response
+
+
+def _error(response):
+    return json.loads(response.body)["error"]
+
+
+class TestErrorResponse:
+    """Test error_response payloads."""
+
+    def test_without_details(self):
+        """Test errors without details omit the details key."""
+        response = error_response(ErrorCode.NOT_FOUND, "Task not found", status_code=404)
+
+        assert response.status_code == 404
+        assert _error(response) == {"code": "not_found", "message": "Task not found"}
+
+    def test_string_details(self):
+        """Test string details are included."""
+        response = error_response(
+            ErrorCode.MISSING_FIELD,
+            "Missing 'message' field",
+            status_code=400,
+            details={"field": "message"},
+        )
+
+        assert _error(response)["details"] == {"field": "message"}
+
+    def test_equal_non_string_details_not_conflated(self):
+        """Test values that compare equal but encode differently stay distinct."""
+        bodies = [
+            _error(error_response(ErrorCode.BAD_REQUEST, "Bad", 400, details={"limit": value}))
+            for value in (1, True, 1.0)
+        ]
+
+        assert [type(b["details"]["limit"]) for b in bodies] == [int, bool, float]
+
+    def test_unhashable_details(self):
+        """Test list details are encoded."""
+        response = error_response(
+            ErrorCode.BAD_REQUEST, "Bad", 400, details={"fields": ["a", "b"]}
+        )
+
+        assert _error(response)["details"] == {"fields": ["a", "b"]}
@@ -296,6 +296,16 @@ class TestResilientLlmClient:
 
         mock_primary.close.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_warm_up_primary(self, mock_primary, mock_fallback):
+        """Warm-up is delegated to the primary client."""
+        client = ResilientLlmClient(primary=mock_primary, fallback=mock_fallback)
+
+        await client.warm_up()
+
+        mock_primary.warm_up.assert_awaited_once()
+        mock_fallback.warm_up.assert_not_called()
+
 
 class TestRulesBasedClientAsFallback:
     """Tests verifying RulesBasedClient works as a fallback."""
@@ -0,0 +1,210 @@
+"""Tests for API-backed LLM client helpers."""
+
+import asyncio
+import sys
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from twinops.agent.llm.base import LlmResponse, ToolCall
+from twinops.agent.llm.openai_compat import (
+    _decode_tool_arguments,
+    _get_shared_sdk_client,
+    _shared_sdk_clients,
+    _ResponseCache,
+    _SemanticResponseCache,
+    close_shared_clients,
+)
+
+
+def _keyword_encoder(texts):
+    """Embed texts by keyword presence so similarity is predictable."""
+    vocab = ("pump", "status", "hello")
+    return np.array([[float(word in text) for word in vocab] for text in texts])
+
+
+def _request(text, system="sys"):
+    return {"model": "m", "system": system, "messages": [{"role": "user", "content": text}]}
+
+
+def _decode(arguments):
+    return _decode_tool_arguments(arguments, "SetSpeed", "call_1")
+
+
+class TestResponseCache:
+    """Test the LLM response cache."""
+
+    def test_key_ignores_dict_order(self):
+        """Test equivalent requests hash to the same key."""
+        a = _ResponseCache.key({"model": "m", "messages": [{"role": "user", "content": "hi"}]})
+        b = _ResponseCache.key({"messages": [{"content": "hi", "role": "user"}], "model": "m"})
+
+        assert a == b
+
+    def test_hit_returns_copy(self):
+        """Test cached responses are isolated from caller mutation."""
+        cache = _ResponseCache(max_entries=2)
+        response = LlmResponse(
+            content=None,
+            tool_calls=[ToolCall(id="call_1", name="StartPump", arguments={})],
+        )
+        cache.put(b"k", response)
+
+        hit = cache.get(b"k")
+        assert hit is not None
+        hit.tool_calls[0].arguments["simulate"] = True
+
+        again = cache.get(b"k")
+        assert again is not None
+        assert again.tool_calls[0].arguments == {}
+
+    def test_evicts_least_recently_used(self):
+        """Test the cache stays bounded."""
+        cache = _ResponseCache(max_entries=2)
+        for key in (b"a", b"b"):
+            cache.put(key, LlmResponse(content=key.decode()))
+        cache.get(b"a")
+        cache.put(b"c", LlmResponse(content="c"))
+
+        assert cache.get(b"b") is None
+        assert cache.get(b"a") is not None
+
+
+class TestDecodeToolArguments:
+    """Test OpenAI tool argument decoding."""
+
+    def test_empty_arguments(self):
+        """Test empty argument strings decode to an empty dict."""
+        assert _decode("") == {}
+        assert _decode("{}") == {}
+
+    def test_json_arguments(self):
+        """Test JSON argument strings are decoded."""
+        assert _decode('{"RPM": 1200}') == {"RPM": 1200}
+
+    def test_invalid_json(self):
+        """Test invalid JSON falls back to an empty dict."""
+        assert _decode("{not json") == {}
+
+
+class TestSemanticResponseCache:
+    """Test the embedding-similarity response cache."""
+
+    def test_paraphrase_hits(self):
+        """Test a similar user message reuses the cached text response."""
+        cache = _SemanticResponseCache(8, threshold=0.9, encoder=_keyword_encoder)
+        key = cache.request_key(_request("what is the pump status"))
+        assert key is not None
+        cache.put(key, LlmResponse(content="Pump is running"))
+
+        hit = cache.get(cache.request_key(_request("pump status please")))
+
+        assert hit is not None
+        assert hit.content == "Pump is running"
+
+    def test_dissimilar_or_other_scope_misses(self):
+        """Test dissimilar messages and different system prompts miss."""
+        cache = _SemanticResponseCache(8, threshold=0.9, encoder=_keyword_encoder)
+        cache.put(cache.request_key(_request("pump status")), LlmResponse(content="ok"))
+
+        assert cache.get(cache.request_key(_request("hello"))) is None
+        assert cache.get(cache.request_key(_request("pump status", system="other"))) is None
+
+    def test_tool_call_responses_not_stored(self):
+        """Test responses with tool calls are never cached."""
+        cache = _SemanticResponseCache(8, threshold=0.9, encoder=_keyword_encoder)
+        key = cache.request_key(_request("start pump"))
+        cache.put(
+            key,
+            LlmResponse(
+                content=None,
+                tool_calls=[ToolCall(id="call_1", name="StartPump", arguments={})],
+            ),
+        )
+
+        assert cache.get(key) is None
+
+    def test_default_model_loaded_once(self, monkeypatch):
+        """Test concurrent first encodes share one sentence-transformers model."""
+        loads = []
+
+        class FakeModel:
+            def __init__(self, name):
+                loads.append(name)
+                time.sleep(0.05)
+
+            def encode(self, texts, normalize_embeddings):
+                return _keyword_encoder(texts)
+
+        fake_module = types.ModuleType("sentence_transformers")
+        fake_module.SentenceTransformer = FakeModel
+        monkeypatch.setitem(sys.modules, "sentence_transformers", fake_module)
+
+        cache = _SemanticResponseCache(8, threshold=0.9)
+        barrier = threading.Barrier(4)
+
+        def encode(text):
+            barrier.wait()
+            return cache._encode(text)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            vectors = list(executor.map(encode, ["pump status"] * 4))
+
+        assert loads == ["all-MiniLM-L6-v2"]
+        assert all(np.allclose(v, vectors[0]) for v in vectors)
+
+
+class _FakeSdkClient:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class TestSharedSdkClients:
+    """Test the per-event-loop SDK client pool."""
+
+    def test_pool_is_per_event_loop(self):
+        """Test clients are reused within a loop but never across loops."""
+
+        async def get_twice():
+            first = _get_shared_sdk_client("openai", "key", 30.0, _FakeSdkClient)
+            second = _get_shared_sdk_client("openai", "key", 30.0, _FakeSdkClient)
+            return first, second
+
+        first, second = asyncio.run(get_twice())
+        other, _ = asyncio.run(get_twice())
+
+        assert first is second
+        assert other is not first
+        # The first loop closed without close_shared_clients(): its pool was
+        # dropped when the second loop looked up a client
+        assert [list(pool.values()) for pool in _shared_sdk_clients.values()] == [[other]]
+        _shared_sdk_clients.clear()
+
+    def test_close_only_closes_running_loop_pool(self):
+        """Test close_shared_clients() leaves other loops' clients open."""
+        loop_a = asyncio.new_event_loop()
+        loop_b = asyncio.new_event_loop()
+
+        async def get():
+            return _get_shared_sdk_client("anthropic", "key", 30.0, _FakeSdkClient)
+
+        try:
+            client_a = loop_a.run_until_complete(get())
+            client_b = loop_b.run_until_complete(get())
+            loop_a.run_until_complete(close_shared_clients())
+
+            assert client_a.closed
+            assert not client_b.closed
+            assert loop_b.run_until_complete(get()) is client_b
+            loop_b.run_until_complete(close_shared_clients())
+            assert client_b.closed
+            assert not _shared_sdk_clients
+        finally:
+            loop_a.close()
+            loop_b.close()
@@ -3,7 +3,11 @@
 import pytest
 
 from twinops.agent.llm.base import Message
-from twinops.agent.llm.rules import RulesBasedClient
+from twinops.agent.llm.rules import (
+    RulesBasedClient,
+    fuzzy_match_tool,
+    normalize_message,
+)
 
 
 @pytest.fixture
@@ -164,7 +168,109 @@ class TestRulesBasedClient:
         assert len(response.tool_calls) == 0
         assert response.content is not None
 
+    @pytest.mark.asyncio
+    async def test_chat_many_preserves_order(self, rules_client, sample_tools):
+        """Test batched chats return responses in request order."""
+        requests = [
+            ([Message(role="user", content=text)], sample_tools, None)
+            for text in ("stop pump", "start pump", "get status")
+        ]
+
+        responses = await rules_client.chat_many(requests, max_concurrency=2)
+
+        assert [r.tool_calls[0].name for r in responses] == ["StopPump", "StartPump", "GetStatus"]
+
+    @pytest.mark.asyncio
+    async def test_stream_chat_yields_full_response(self, rules_client, sample_tools):
+        """Test clients without native streaming yield one complete response."""
+        messages = [Message(role="user", content="start pump")]
+
+        chunks = [chunk async for chunk in rules_client.stream_chat(messages, sample_tools)]
+
+        assert len(chunks) == 1
+        assert chunks[0].tool_calls[0].name == "StartPump"
+
+    @pytest.mark.asyncio
+    async def test_tool_map_reused_across_new_lists(self, rules_client, sample_tools):
+        """Test the tool map is keyed on tool names, not on the list object."""
+        messages = [Message(role="user", content="start pump")]
+
+        await rules_client.chat(messages, tools=list(sample_tools))
+        first_map = rules_client._tools_cache[1]
+        await rules_client.chat(messages, tools=list(sample_tools))
+
+        assert rules_client._tools_cache[1] is first_map
+
+        response = await rules_client.chat(
+            [Message(role="user", content="do something random")],
+            tools=sample_tools[:1],
+        )
+        assert "StartPump" in response.content
+        assert "StopPump" not in response.content
+
+    @pytest.mark.asyncio
+    async def test_specific_pattern_priority_is_list_order(self, rules_client, sample_tools):
+        """Test the earlier pattern wins even when a later one occurs first in the text."""
+        messages = [Message(role="user", content="status check, then start pump")]
+
+        response = await rules_client.chat(messages, tools=sample_tools)
+
+        assert response.tool_calls[0].name == "StartPump"
+
+    @pytest.mark.asyncio
+    async def test_specific_pattern_falls_through_missing_tool(self, rules_client, sample_tools):
+        """Test a matching pattern whose tool is unavailable yields to later patterns."""
+        tools = [t for t in sample_tools if t["name"] != "SetSpeed"]
+        messages = [Message(role="user", content="set speed to 1200 and get status")]
+
+        response = await rules_client.chat(messages, tools=tools)
+
+        assert response.tool_calls[0].name == "GetStatus"
+
     @pytest.mark.asyncio
     async def test_close(self, rules_client):
         """Test close is a no-op."""
         await rules_client.close()  # Should not raise
+
+
+class TestNormalizeMessage:
+    """Test user message normalization."""
+
+    def test_strips_stacked_prefixes(self):
+        """Test several polite prefixes are stripped in one pass."""
+        assert normalize_message("Please can you start the pump") == "start the pump"
+
+    def test_without_prefix_unchanged(self):
+        """Test messages without a prefix are only lowercased."""
+        assert normalize_message("  Start the pump ") == "start the pump"
+
+    def test_prefix_only_stripped_at_start(self):
+        """Test prefixes in the middle of a message are kept."""
+        assert normalize_message("i'd like you to say please") == "say please"
+
+
+class TestFuzzyMatchTool:
+    """Test fuzzy tool name matching."""
+
+    def test_camel_case_word_overlap(self):
+        """Test CamelCase names are split into words for overlap scoring."""
+        tools = {"StartPump": {}, "SetSpeed": {}}
+
+        assert fuzzy_match_tool("SetPumpSpeed", tools) == "SetSpeed"
+
+    def test_single_shared_word_rejected(self):
+        """Test sharing one word of two is not enough to match."""
+        assert fuzzy_match_tool("StopPump", {"StartPump": {}}) is None
+
+    def test_large_catalog_word_overlap(self):
+        """Test word matching over a catalog large enough to use the index."""
+        tools = {f"ReadSensor{i}Value": {} for i in range(20)}
+        tools["SetPumpSpeed"] = {}
+        tools["SetValveSpeed"] = {}
+
+        assert fuzzy_match_tool("ChangePumpSpeed", tools) == "SetPumpSpeed"
+        assert fuzzy_match_tool("StopPump", tools) is None
+
+    def test_no_overlap(self):
+        """Test unrelated names do not match."""
+        assert fuzzy_match_tool("OpenValve", {"StartPump": {}}) is None
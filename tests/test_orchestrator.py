@@ -78,6 +78,18 @@ async def test_simple_query_no_tools(orchestrator, mock_llm):
     assert "1000" in response.reply or "speed" in response.reply.lower()
     assert response.tool_results == []
     assert response.pending_approval is False
+    assert response.cacheable is True
+
+
+@pytest.mark.asyncio
+async def test_llm_failure_not_cacheable(orchestrator, mock_llm):
+    """Test error replies are never marked safe to replay."""
+    mock_llm.chat.side_effect = RuntimeError("boom")
+
+    response = await orchestrator.process_message("What is the pump speed?", roles=("operator",))
+
+    assert response.reply == "LLM request failed."
+    assert response.cacheable is False
 
 
 @pytest.mark.asyncio
@@ -136,6 +148,7 @@ async def test_tool_execution_with_safety_allowed(
     assert len(response.tool_results) == 1
     assert response.tool_results[0].tool_name == "SetSpeed"
     assert response.tool_results[0].simulated is True
+    assert response.cacheable is False
 
 
 @pytest.mark.asyncio
@@ -10,6 +10,7 @@ from twinops.agent.policy_signing import (
     PolicyVerificationError,
     generate_keypair,
     sign_policy,
+    verify_batch,
     verify_policy_signature,
 )
 
@@ -124,3 +125,23 @@ class TestPolicySigning:
         assert verify_policy_signature(policy1, public_pem, signature) is True
         # Should NOT verify with reordered JSON
         assert verify_policy_signature(policy2, public_pem, signature) is False
+
+    def test_verify_batch(self, keypair):
+        """Test batch verification preserves order and detects tampering."""
+        private_pem, public_pem = keypair
+        policies = [json.dumps({"id": i}) for i in range(4)]
+        items = [(p, public_pem, sign_policy(p, private_pem)) for p in policies]
+        items[2] = ('{"id": "tampered"}', public_pem, items[2][2])
+
+        assert verify_batch(items) == [True, True, False, True]
+
+    def test_sign_and_verify_bytes(self, keypair):
+        """Test that bytes and str inputs produce interchangeable signatures."""
+        private_pem, public_pem = keypair
+        policy_json = '{"name": "Pumpe \u00fc"}'
+
+        signature = sign_policy(policy_json.encode("utf-8"), private_pem)
+
+        assert signature == sign_policy(policy_json, private_pem)
+        assert verify_policy_signature(policy_json, public_pem, signature) is True
+        assert verify_policy_signature(policy_json.encode("utf-8"), public_pem, signature) is True
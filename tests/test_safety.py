@@ -1,5 +1,6 @@
 """Tests for safety kernel functionality."""
 
+import asyncio
 import json
 import os
 import tempfile
@@ -120,6 +121,97 @@ class TestAuditLogger:
         assert is_valid is False
         assert 1 in broken  # First line is corrupted
 
+    @pytest.mark.asyncio
+    async def test_background_writer_keeps_chain(self, temp_log_file):
+        """Test entries queued to the writer thread are flushed and chained."""
+        logger = AuditLogger(temp_log_file)
+        logger.log(event="before")
+        logger.start_writer()
+
+        for i in range(5):
+            logger.log(event="queued", index=i)
+        await logger.aclose()
+        logger.log(event="after")
+
+        with open(temp_log_file) as f:
+            entries = [json.loads(line) for line in f]
+
+        assert [e["event"] for e in entries] == ["before"] + ["queued"] * 5 + ["after"]
+        assert logger.verify_chain() == (True, [])
+
+    @pytest.mark.asyncio
+    async def test_background_write_failure_counted(self, temp_log_file, monkeypatch):
+        """Test entries the writer thread cannot persist are counted, not lost silently."""
+        logger = AuditLogger(temp_log_file)
+        logger.start_writer()
+
+        def fail(_file_obj, _entries):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(logger, "_write_entries", fail)
+        for i in range(3):
+            logger.log(event="queued", index=i)
+        await logger.aclose()
+
+        assert logger.dropped_entries == 3
+        assert not logger.is_healthy
+
+    @pytest.mark.asyncio
+    async def test_writer_survives_unexpected_errors(self, temp_log_file, monkeypatch):
+        """Test a non-OSError failure is counted and later entries are still written."""
+        logger = AuditLogger(temp_log_file)
+        write_entries = logger._write_entries
+        calls = []
+
+        def fail_once(file_obj, entries):
+            calls.append(len(entries))
+            if len(calls) == 1:
+                raise ValueError("bad entry")
+            write_entries(file_obj, entries)
+
+        monkeypatch.setattr(logger, "_write_entries", fail_once)
+        logger.start_writer()
+        logger.log(event="dropped")
+        while not calls:
+            await asyncio.sleep(0.01)
+        assert logger._writer is not None and logger._writer.is_alive()
+        logger.log(event="kept")
+        await logger.aclose()
+
+        with open(temp_log_file) as f:
+            entries = [json.loads(line) for line in f]
+
+        assert [e["event"] for e in entries] == ["kept"]
+        assert logger.dropped_entries == 1
+
+    @pytest.mark.asyncio
+    async def test_background_entry_snapshot(self, temp_log_file):
+        """Test queued entries are not affected by later caller mutation."""
+        logger = AuditLogger(temp_log_file)
+        logger.start_writer()
+        result = {"status": "ok"}
+
+        logger.log(event="executed", result=result)
+        result["status"] = "changed"
+        with pytest.raises(TypeError):
+            logger.log(event="executed", result={"value": object()})
+        await logger.aclose()
+
+        with open(temp_log_file) as f:
+            entries = [json.loads(line) for line in f]
+
+        assert [e["result"] for e in entries] == [{"status": "ok"}]
+        assert logger.is_healthy
+
+    def test_dead_writer_unhealthy(self, temp_log_file):
+        """Test a writer thread that is no longer running marks the log unhealthy."""
+        logger = AuditLogger(temp_log_file)
+        assert logger.is_healthy
+
+        logger._writer = MagicMock(is_alive=MagicMock(return_value=False))
+
+        assert not logger.is_healthy
+
 
 class TestSafetyKernel:
     """Test safety kernel functionality."""
@@ -1,5 +1,7 @@
 """Tests for AAS-to-Tool schema generation."""
 
+import dataclasses
+
 import pytest
 
 from twinops.agent.schema_gen import (
@@ -151,3 +153,16 @@ class TestOperationSchema:
         assert llm_format["description"] == "Test operation"
         assert "input_schema" in llm_format
         assert "parameters" in llm_format  # OpenAI compatibility
+
+    def test_tool_spec_is_immutable(self):
+        """Test shared ToolSpecs cannot be modified."""
+        tool = ToolSpec(
+            name="TestOp",
+            description="Test operation",
+            input_schema={"type": "object", "properties": {}},
+            submodel_id="urn:test",
+            operation_path="TestOp",
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            tool.risk_level = "HIGH"  # type: ignore[misc]
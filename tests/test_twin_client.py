@@ -148,6 +148,20 @@ class TestTwinClientCircuitBreaker:
         assert twin_client.circuit_breaker is not None
         assert isinstance(twin_client.circuit_breaker, CircuitBreaker)
 
+    @pytest.mark.asyncio
+    async def test_session_uses_pooled_connector(self, settings):
+        """Each session gets a fresh connector sized from settings."""
+        client = TwinClient(settings)
+
+        async with client:
+            first = client._ensure_session().connector
+        async with client:
+            second = client._ensure_session().connector
+
+            assert second is not first
+            assert not second.closed
+            assert second.limit == settings.twin_client_pool_size
+
     @pytest.mark.asyncio
     async def test_circuit_opens_on_server_errors(self, settings):
         """Circuit opens after repeated 5xx errors."""